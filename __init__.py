@@ -1,13 +1,37 @@
 import bpy
 
+from . import frame_cache
+from . import frame_pending
 from . import frame_functions
 from . import color_functions
+from . import blend_index
+from . import frame_spatial
+from . import frame_handles
+from . import frame_snapshot
+from . import batch_engine
+from . import profiling
 
 def register():
+    frame_cache.register()
+    frame_pending.register()
     color_functions.register()
     frame_functions.register()
+    blend_index.register()
+    frame_spatial.register()
+    frame_handles.register()
+    frame_snapshot.register()
+    batch_engine.register()
+    profiling.register((frame_functions, color_functions, blend_index, frame_spatial, frame_handles, frame_snapshot, batch_engine))
 
 def unregister():
+    profiling.unregister()
+    batch_engine.unregister()
+    frame_snapshot.unregister()
+    frame_handles.unregister()
+    frame_spatial.unregister()
+    blend_index.unregister()
     frame_functions.unregister()
     color_functions.unregister()
+    frame_pending.unregister()
+    frame_cache.unregister()
     
\ No newline at end of file
@@ -0,0 +1,283 @@
+import bpy
+import time
+from collections import deque
+from fnmatch import fnmatchcase
+from bpy.app.handlers import persistent
+from .blend_index import tree_owners
+from .color_functions import palette_colors
+from .frame_cache import frame_index, order_mode
+from .frame_core import (DEFAULT_COLOR, ORDER_ITEMS, reorder_tree, set_colors, set_custom_color,
+                         set_default_colors)
+from .frame_view import tag_node_editors
+from .node_bulk import write_frame_flags
+
+
+# [ Tree Sets ]
+SCOPE_ITEMS = [
+    ('MATERIALS','Materials','Node trees of all materials','MATERIAL',0),
+    ('NODE_GROUPS','Node Groups','All node groups','NODETREE',1),
+    ('ALL','All Trees','Every node tree of the file','BLENDER',2),
+]
+
+def batch_trees(scope, pattern=''):
+    """(owner name, tree) of the trees in `scope` whose owner matches `pattern` (case-insensitive glob)"""
+    pattern = pattern.strip().lower()
+    result = []
+    for kind, owner, tree in tree_owners():
+        if scope == 'MATERIALS' and kind != 'MATERIAL':
+            continue
+        if scope == 'NODE_GROUPS' and kind != 'NODE_GROUP':
+            continue
+        if pattern and not fnmatchcase(owner.name.lower(), pattern):
+            continue
+        result.append((owner.name, tree))
+    return result
+
+
+# [ Actions ]
+# Each action edits one tree and returns the number of nodes it changed
+ACTION_ITEMS = [
+    ('COLOR','Set Color','Set the color of the frames (or nodes)','COLOR',0),
+    ('DEFAULT_COLOR','Default Color','Reset the color of the frames (or nodes)','LOOP_BACK',1),
+    ('CUSTOM_COLOR','Custom Color','Turn custom colors on or off','RESTRICT_COLOR_ON',2),
+    ('SHRINK','Shrink','Turn frame shrink on or off','MOD_LENGTH',3),
+    ('LABEL_SIZE','Label Size','Set the label size of the frames','OUTLINER_OB_FONT',4),
+    ('REORDER','Reorder','Sort all frames by label, color or reverse them','SEQ_STRIP_DUPLICATE',5),
+]
+def tree_action(action, mode='NAME', frames_only=True, color=DEFAULT_COLOR, flag=True,
+                label_size=20, useType='0', is_invert=False, palette=None):
+    """Function editing one tree with the given settings"""
+    def run(Tree):
+        if action == 'COLOR':
+            return set_colors(Tree, color, frames_only, False, mode)
+        if action == 'DEFAULT_COLOR':
+            return set_default_colors(Tree, frames_only, False, mode)
+        if action == 'CUSTOM_COLOR':
+            return set_custom_color(Tree, flag, frames_only, False, mode)
+        if action == 'SHRINK':
+            return write_frame_flags(Tree, frame_index(Tree, mode).frames, 'shrink', flag)
+        if action == 'LABEL_SIZE':
+            return write_frame_flags(Tree, frame_index(Tree, mode).frames, 'label_size', label_size)
+        if action == 'REORDER':
+            return reorder_tree(Tree, useType, is_invert, False, mode, palette)
+        raise ValueError(f"unknown batch action: {action!r}")
+    return run
+
+
+# [ Jobs ]
+# One job at a time. The timer works through the trees until its time slice is
+# used up, then yields to the UI; the progress is drawn by the batch panel.
+SLICE = 0.02
+INTERVAL = 0.01
+
+class BatchJob:
+    def __init__(self, title, trees, func):
+        self.title = title
+        self.trees = deque(trees)
+        self.func = func
+        self.total = len(self.trees)
+        self.done = 0
+        self.changed = 0
+        self.skipped = 0
+        self.cancelled = False
+        self.started = time.perf_counter()
+
+    @property
+    def progress(self):
+        return self.done / self.total if self.total else 1.0
+
+    def step(self, budget=SLICE):
+        """Process trees for about `budget` seconds, returns False once finished"""
+        deadline = time.perf_counter() + budget
+        while self.trees and not self.cancelled:
+            owner_name, Tree = self.trees.popleft()
+            try:
+                self.changed += self.func(Tree)
+            except ReferenceError:
+                # Removed since the job started
+                self.skipped += 1
+            self.done += 1
+            if time.perf_counter() >= deadline:
+                break
+        return bool(self.trees) and not self.cancelled
+
+    def summary(self):
+        state = 'cancelled' if self.cancelled else 'done'
+        seconds = time.perf_counter() - self.started
+        return (f"{self.title}: {state}, {self.done}/{self.total} tree(s), "
+                f"{self.changed} node(s) changed in {seconds:.1f}s")
+
+
+_state = {'job':None, 'last':''}
+
+def running_job():
+    return _state['job']
+
+def last_summary():
+    return _state['last']
+
+
+def start(title, trees, func):
+    if _state['job'] is not None:
+        raise RuntimeError("a batch job is already running")
+    _state['job'] = BatchJob(title, trees, func)
+    bpy.app.timers.register(_tick, first_interval=0.0)
+    return _state['job']
+
+
+def cancel():
+    job = _state['job']
+    if job is not None:
+        job.cancelled = True
+
+
+def _tick():
+    job = _state['job']
+    if job is None:
+        return None
+    if job.step():
+        tag_node_editors()
+        return INTERVAL
+    _state['job'] = None
+    _state['last'] = job.summary()
+    if job.changed:
+        # Everything the job wrote (even when cancelled halfway) is one undo step
+        bpy.ops.ed.undo_push(message=job.title)
+    tag_node_editors()
+    return None
+
+
+def clear():
+    if bpy.app.timers.is_registered(_tick):
+        bpy.app.timers.unregister(_tick)
+    _state['job'] = None
+
+
+# [ Operator ]
+class FRAMEFOCUS_OT_Batch_Trees(bpy.types.Operator):
+    """Edit The Frames Of Many Node Trees In The Background"""
+    bl_idname = "frame_focus.batch_trees"
+    bl_label = "Batch Edit Node Trees"
+    scope : bpy.props.EnumProperty(name='Trees', items=SCOPE_ITEMS, default='MATERIALS')
+    pattern : bpy.props.StringProperty(name='Filter', default='',
+                                       description='Only trees whose owner name matches this pattern (* and ? wildcards)')
+    action : bpy.props.EnumProperty(name='Action', items=ACTION_ITEMS, default='COLOR')
+    frames_only : bpy.props.BoolProperty(name='Frames Only', default=True)
+    color : bpy.props.FloatVectorProperty(name='Color', min=0.0, max=1.0, subtype='COLOR_GAMMA',
+                                          default=(0.4, 0.08, 0.08))
+    flag : bpy.props.BoolProperty(name='On', default=True)
+    label_size : bpy.props.IntProperty(name='Label Size', default=20, min=8, max=64)
+    useType : bpy.props.EnumProperty(name='Order By', items=ORDER_ITEMS, default='0')
+    is_invert : bpy.props.BoolProperty(name='Use Invert', default=False)
+
+    @classmethod
+    def poll(cls, context):
+        return running_job() is None
+
+    def execute(self, context):
+        trees = batch_trees(self.scope, self.pattern)
+        if not trees:
+            self.report({'WARNING'}, "No node tree matches")
+            return {'CANCELLED'}
+        func = tree_action(self.action, order_mode(context), self.frames_only, tuple(self.color),
+                           self.flag, self.label_size, self.useType, self.is_invert,
+                           palette_colors(context.scene.frame_color))
+        title = dict((item[0], item[1]) for item in ACTION_ITEMS)[self.action]
+        start(f"Batch {title}", trees, func)
+        self.report({'INFO'}, f"{len(trees)} node tree(s) queued")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self,'scope')
+        layout.prop(self,'pattern',icon='FILTER')
+        layout.prop(self,'action')
+        if self.action in {'COLOR', 'DEFAULT_COLOR', 'CUSTOM_COLOR'}:
+            layout.prop(self,'frames_only')
+        if self.action == 'COLOR':
+            layout.prop(self,'color')
+        if self.action in {'CUSTOM_COLOR', 'SHRINK'}:
+            layout.prop(self,'flag')
+        if self.action == 'LABEL_SIZE':
+            layout.prop(self,'label_size')
+        if self.action == 'REORDER':
+            layout.prop(self,'useType')
+            if self.useType != '2':
+                layout.prop(self,'is_invert')
+
+class FRAMEFOCUS_OT_Batch_Cancel(bpy.types.Operator):
+    """Stop The Running Batch Edit, Trees Already Done Keep Their Changes"""
+    bl_idname = "frame_focus.batch_cancel"
+    bl_label = "Cancel Batch Edit"
+
+    @classmethod
+    def poll(cls, context):
+        return running_job() is not None
+
+    def execute(self, context):
+        cancel()
+        return {'FINISHED'}
+
+
+# [ Panel ]
+class FRAMEFOCUS_PT_Batch(bpy.types.Panel):
+    bl_idname = "FRAMEFOCUS_PT_Batch"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Frames"
+    bl_label = 'Batch Node Trees'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_parent_id = "FRAMEFOCUS_PT_Main"
+    bl_order = 80
+
+    def draw(self, context):
+        layout = self.layout
+        job = running_job()
+        if job is None:
+            layout.operator("frame_focus.batch_trees",icon='NODETREE')
+            if last_summary():
+                layout.label(text=last_summary(),icon='INFO')
+            return None
+        row = layout.row(align=True)
+        row.progress(factor=job.progress, type='BAR', text=f"{job.title} {job.done}/{job.total}")
+        row.operator("frame_focus.batch_cancel",text='',icon='CANCEL')
+
+
+classes = (
+    FRAMEFOCUS_OT_Batch_Trees,
+    FRAMEFOCUS_OT_Batch_Cancel,
+    FRAMEFOCUS_PT_Batch,
+)
+
+
+# [ Handlers ]
+@persistent
+def _on_reload(*args):
+    # Undo / file load: queued tree references are no longer valid
+    clear()
+
+
+_handlers = (
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+    (bpy.app.handlers.load_post, _on_reload),
+)
+
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    for handlers, func in _handlers:
+        if func not in handlers:
+            handlers.append(func)
+
+def unregister():
+    for handlers, func in _handlers:
+        if func in handlers:
+            handlers.remove(func)
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
+    clear()
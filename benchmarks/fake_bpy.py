@@ -0,0 +1,582 @@
+"""Minimal stand-in for the parts of `bpy` used by the add-on.
+
+Only good enough to import the add-on and run its operators / panel draws under
+plain CPython. Node collections keep Blender's unique-name behaviour (".001"
+suffixes) and support foreach_get / foreach_set, but the C-side cost of RNA is
+not modelled: timings measure the add-on's Python work.
+"""
+import os
+import sys
+import tempfile
+import types
+import colorsys
+from contextlib import contextmanager
+
+
+# [ Math ]
+class Vector(list):
+    @property
+    def x(self):
+        return self[0]
+
+    @x.setter
+    def x(self, value):
+        self[0] = value
+
+    @property
+    def y(self):
+        return self[1]
+
+    @y.setter
+    def y(self, value):
+        self[1] = value
+
+
+class Color(list):
+    @property
+    def hsv(self):
+        return colorsys.rgb_to_hsv(*self)
+
+
+# [ Data ]
+class IDPropertyMixin:
+    def _idprops(self):
+        props = self.__dict__.get('_props')
+        if props is None:
+            props = self.__dict__['_props'] = {}
+        return props
+
+    def get(self, key, default=None):
+        return self._idprops().get(key, default)
+
+    def __getitem__(self, key):
+        return self._idprops()[key]
+
+    def __setitem__(self, key, value):
+        self._idprops()[key] = value
+
+    def __contains__(self, key):
+        return key in self._idprops()
+
+    def as_pointer(self):
+        return id(self)
+
+
+class Text(IDPropertyMixin):
+    def __init__(self, name):
+        self.name = name
+
+
+class Node(IDPropertyMixin):
+    type = 'CUSTOM'
+    bl_idname = 'NodeUndefined'
+
+    def __init__(self, collection, name):
+        self.__dict__['_collection'] = collection
+        self.__dict__['name'] = name
+        self.label = ''
+        self.select = False
+        self.hide = False
+        self.mute = False
+        self.use_custom_color = False
+        self.color = Color((0.608, 0.608, 0.608))
+        self.location = Vector((0.0, 0.0))
+        self.dimensions = Vector((140.0, 100.0))
+        self.parent = None
+
+    def __setattr__(self, key, value):
+        if key == 'name':
+            value = self._collection._rename(self, value)
+        elif key == 'color':
+            value = Color(value)
+        elif key == 'location':
+            value = Vector(value)
+        self.__dict__[key] = value
+
+    def __repr__(self):
+        return f"<{type(self).__name__} {self.name!r}>"
+
+
+class FrameNode(Node):
+    type = 'FRAME'
+    bl_idname = 'NodeFrame'
+
+    def __init__(self, collection, name):
+        super().__init__(collection, name)
+        self.shrink = True
+        self.label_size = 20
+        self.text = None
+
+
+class ShaderNode(Node):
+    type = 'MIX'
+    bl_idname = 'ShaderNodeMix'
+
+
+NODE_TYPES = {
+    'NodeFrame': FrameNode,
+    'ShaderNodeMix': ShaderNode,
+}
+
+VECTOR_ATTRS = {'color': 3, 'location': 2, 'dimensions': 2}
+
+
+class Nodes:
+    """bpy_prop_collection of nodes with unique names"""
+    def __init__(self, tree):
+        self.tree = tree
+        self._nodes = []
+        self._by_name = {}
+        self._suffix = {}
+        self.active = None
+
+    def _unique(self, name, node=None):
+        if name not in self._by_name or self._by_name[name] is node:
+            return name
+        base, _, suffix = name.rpartition('.')
+        if not (base and suffix.isdigit()):
+            base = name
+        # Start from the last suffix handed out for this base, not from .001
+        i = self._suffix.get(base, 1)
+        while f"{base}.{i:03d}" in self._by_name:
+            i += 1
+        self._suffix[base] = i
+        return f"{base}.{i:03d}"
+
+    def _rename(self, node, name):
+        old = node.__dict__.get('name')
+        if old == name:
+            return name
+        name = self._unique(name, node)
+        if self._by_name.get(old) is node:
+            del self._by_name[old]
+        self._by_name[name] = node
+        return name
+
+    def new(self, type):
+        cls = NODE_TYPES[type]
+        base = 'Frame' if cls is FrameNode else 'Mix'
+        node = cls(self, self._unique(base))
+        self._by_name[node.name] = node
+        self._nodes.append(node)
+        self.tree.update_tag()
+        return node
+
+    def remove(self, node):
+        self._nodes.remove(node)
+        del self._by_name[node.name]
+        for nd in self._nodes:
+            if nd.parent is node:
+                nd.parent = None
+        self.tree.update_tag()
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __bool__(self):
+        return True
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._by_name[key]
+        return self._nodes[key]
+
+    def get(self, key, default=None):
+        return self._by_name.get(key, default)
+
+    def foreach_get(self, attr, buf):
+        size = VECTOR_ATTRS.get(attr)
+        if size:
+            flat = [c for nd in self._nodes for c in getattr(nd, attr)]
+        else:
+            flat = [getattr(nd, attr) for nd in self._nodes]
+        if len(flat) != len(buf):
+            raise RuntimeError(f"foreach_get('{attr}') buffer size mismatch")
+        buf[:] = flat
+
+    def foreach_set(self, attr, buf):
+        size = VECTOR_ATTRS.get(attr)
+        values = list(buf)
+        if size:
+            for i, nd in enumerate(self._nodes):
+                nd.__dict__[attr] = type(getattr(nd, attr))(float(v) for v in values[i * size:(i + 1) * size])
+        else:
+            for nd, value in zip(self._nodes, values):
+                if not hasattr(nd, attr):
+                    raise AttributeError(f"foreach_set: '{attr}' not found")
+                nd.__dict__[attr] = type(getattr(nd, attr))(value)
+
+
+class NodeTree(IDPropertyMixin):
+    bl_idname = 'ShaderNodeTree'
+
+    def __init__(self, name):
+        self.name = name
+        self.nodes = Nodes(self)
+        self.updates = 0
+
+    def update_tag(self):
+        self.updates += 1
+
+
+class DataCollection(list):
+    def get(self, name, default=None):
+        return next((item for item in self if item.name == name), default)
+
+
+# [ UI ]
+class UILayout:
+    """Records how many UI items a draw call builds"""
+    def __init__(self, counter=None):
+        self.counter = counter if counter is not None else [0]
+        self.enabled = True
+        self.alignment = 'EXPAND'
+        self.active = True
+
+    def _item(self):
+        self.counter[0] += 1
+        return UILayout(self.counter)
+
+    def row(self, **kwargs):
+        return self._item()
+
+    def column(self, **kwargs):
+        return self._item()
+
+    def box(self):
+        return self._item()
+
+    def split(self, **kwargs):
+        return self._item()
+
+    def menu_pie(self):
+        return self._item()
+
+    def prop(self, *args, **kwargs):
+        self._item()
+
+    def label(self, **kwargs):
+        self._item()
+
+    def separator(self, **kwargs):
+        self._item()
+
+    def menu(self, *args, **kwargs):
+        self._item()
+
+    def operator(self, *args, **kwargs):
+        self._item()
+        return types.SimpleNamespace()
+
+    def progress(self, **kwargs):
+        self._item()
+
+    def template_list(self, listtype_name, list_id, dataptr, propname, active_dataptr, active_propname, rows=5, **kwargs):
+        self._item()
+        ui_list = _registered.get(listtype_name)
+        if ui_list is None:
+            return
+        ui_list = ui_list()
+        items = getattr(dataptr, propname)
+        flags, neworder = ui_list.filter_items(_context, dataptr, propname)
+        shown = [i for i in range(len(items)) if not flags or flags[i] & ui_list.bitflag_filter_item]
+        if neworder:
+            shown.sort(key=neworder.__getitem__)
+        for i in shown[:rows]:
+            ui_list.draw_item(_context, self._item(), dataptr, items[i], 0, active_dataptr, active_propname, i)
+
+
+class View2D:
+    def __init__(self):
+        self.zoom = 1.0
+        self.offset = (0.0, 0.0)
+
+    def view_to_region(self, x, y, clip=True):
+        return (x - self.offset[0]) * self.zoom, (y - self.offset[1]) * self.zoom
+
+    def region_to_view(self, x, y):
+        return x / self.zoom + self.offset[0], y / self.zoom + self.offset[1]
+
+
+class Region:
+    def __init__(self, type, width=1200, height=800):
+        self.type = type
+        self.width = width
+        self.height = height
+        self.view2d = View2D()
+
+    def tag_redraw(self):
+        pass
+
+
+class Area:
+    def __init__(self):
+        self.type = 'NODE_EDITOR'
+        self.regions = [Region('HEADER', height=26), Region('WINDOW'), Region('UI', width=300)]
+
+    def tag_redraw(self):
+        pass
+
+
+class SpaceNodeEditor:
+    type = 'NODE_EDITOR'
+
+    def __init__(self, tree):
+        self.node_tree = tree
+        self.tree_type = tree.bl_idname if tree else 'ShaderNodeTree'
+        self.pin = False
+        self.shader_type = 'OBJECT'
+
+    @property
+    def edit_tree(self):
+        return self.node_tree
+
+
+class PropertyGroupInstance:
+    """Instance of a registered PropertyGroup, filled with the annotation defaults"""
+    def __init__(self, cls):
+        for name, prop in getattr(cls, '__annotations__', {}).items():
+            if isinstance(prop, _Property):
+                setattr(self, name, prop.default_value())
+        self._idprops = {}
+
+    def get(self, key, default=None):
+        return self._idprops.get(key, default)
+
+
+class Context:
+    def __init__(self, tree, scene):
+        self.area = Area()
+        self.region = self.area.regions[2]
+        self.space_data = SpaceNodeEditor(tree)
+        self.scene = scene
+        self.window = types.SimpleNamespace(screen=None)
+        self.window_manager = types.SimpleNamespace(
+            invoke_popup=lambda op, **kw: {'RUNNING_MODAL'},
+            invoke_props_dialog=lambda op, **kw: {'RUNNING_MODAL'},
+            invoke_search_popup=lambda op: None,
+            windows=[],
+        )
+        self.preferences = types.SimpleNamespace(system=types.SimpleNamespace(ui_scale=1.0))
+        self.view_layer = types.SimpleNamespace(objects=DataCollection())
+
+    @contextmanager
+    def temp_override(self, **kwargs):
+        yield self
+
+
+# [ bpy.props ]
+class _Property:
+    def __init__(self, kind, **kwargs):
+        self.kind = kind
+        self.kwargs = kwargs
+
+    def default_value(self):
+        default = self.kwargs.get('default')
+        if self.kind == 'PointerProperty':
+            return PropertyGroupInstance(self.kwargs['type'])
+        if self.kind == 'EnumProperty':
+            items = self.kwargs.get('items')
+            if isinstance(default, int) and isinstance(items, (list, tuple)):
+                return items[default][0]
+            if default is None and isinstance(items, (list, tuple)) and items:
+                return items[0][0]
+        if self.kind == 'FloatVectorProperty':
+            return list(default) if default is not None else [0.0, 0.0, 0.0]
+        if self.kind == 'CollectionProperty':
+            return []
+        if default is None:
+            return {'BoolProperty': False, 'IntProperty': 0, 'FloatProperty': 0.0, 'StringProperty': ''}.get(self.kind)
+        return default
+
+
+def _prop_factory(kind):
+    return lambda **kwargs: _Property(kind, **kwargs)
+
+
+# [ Module ]
+_registered = {}
+_context = None
+
+
+class _Struct:
+    bl_idname = ''
+
+    @classmethod
+    def is_registered(cls):
+        return cls.__name__ in _registered
+
+
+class Operator(_Struct):
+    def __init__(self):
+        for name, prop in getattr(type(self), '__annotations__', {}).items():
+            if isinstance(prop, _Property):
+                setattr(self, name, prop.default_value())
+        self.reports = []
+        self.layout = UILayout()
+
+    def report(self, kind, message):
+        self.reports.append((kind, message))
+
+
+class Panel(_Struct):
+    def __init__(self):
+        self.layout = UILayout()
+
+
+class Menu(Panel):
+    def draw_preset(self, context):
+        pass
+
+
+class UIList(_Struct):
+    bitflag_filter_item = 1 << 30
+
+
+class PropertyGroup(_Struct):
+    pass
+
+
+class _OpsModule:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    def __getattr__(self, op):
+        def call(*args, **kwargs):
+            self.calls.append((op, kwargs))
+            cls = _registered_ops.get(f"{self.name}.{op}")
+            if cls is not None and _context is not None:
+                inst = cls()
+                for key, value in kwargs.items():
+                    setattr(inst, key, value)
+                return inst.execute(_context)
+            return {'FINISHED'}
+        return call
+
+
+class _Ops:
+    def __init__(self):
+        self._modules = {}
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return self._modules.setdefault(name, _OpsModule(name))
+
+
+_registered_ops = {}
+
+
+def register_class(cls):
+    _registered[cls.__name__] = cls
+    if issubclass(cls, Operator) and cls.bl_idname:
+        _registered_ops[cls.bl_idname] = cls
+
+
+def unregister_class(cls):
+    _registered.pop(cls.__name__, None)
+    if issubclass(cls, Operator):
+        _registered_ops.pop(cls.bl_idname, None)
+
+
+def persistent(func):
+    return func
+
+
+class _Timers:
+    def __init__(self):
+        self.funcs = []
+
+    def register(self, func, first_interval=0.0, persistent=False):
+        self.funcs.append(func)
+
+    def unregister(self, func):
+        if func in self.funcs:
+            self.funcs.remove(func)
+
+    def is_registered(self, func):
+        return func in self.funcs
+
+    def run(self):
+        """Run pending timers until they all return None"""
+        while self.funcs:
+            for func in list(self.funcs):
+                if func() is None:
+                    self.unregister(func)
+
+
+def extension_path_user(package, path='', create=False):
+    directory = os.path.join(tempfile.gettempdir(), 'fake_bpy_extensions', package, path)
+    if create:
+        os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def set_context(context):
+    global _context
+    _context = context
+    sys.modules['bpy'].context = context
+
+
+def install():
+    """Insert the fake `bpy` / `bl_operators` modules into sys.modules"""
+    bpy = types.ModuleType('bpy')
+    bpy.__path__ = []
+    bpy.types = types.ModuleType('bpy.types')
+    bpy.types.__dict__.update(
+        Operator=Operator, Panel=Panel, Menu=Menu, UIList=UIList, PropertyGroup=PropertyGroup,
+        NodeTree=NodeTree, Node=Node, FrameNode=FrameNode, NodeFrame=FrameNode, Scene=types.SimpleNamespace(),
+        WindowManager=types.SimpleNamespace(), NODE_MT_context_menu=types.SimpleNamespace(),
+    )
+    bpy.props = types.SimpleNamespace(**{kind: _prop_factory(kind) for kind in (
+        'BoolProperty', 'IntProperty', 'FloatProperty', 'StringProperty', 'EnumProperty',
+        'FloatVectorProperty', 'IntVectorProperty', 'PointerProperty', 'CollectionProperty')})
+    bpy.utils = types.SimpleNamespace(
+        register_class=register_class, unregister_class=unregister_class,
+        user_resource=lambda *args, **kwargs: '',
+        extension_path_user=extension_path_user,
+    )
+    handlers = types.SimpleNamespace(
+        depsgraph_update_post=[], undo_post=[], redo_post=[], load_post=[], save_pre=[],
+        persistent=persistent,
+    )
+    handlers_module = types.ModuleType('bpy.app.handlers')
+    handlers_module.__dict__.update(vars(handlers))
+    bpy.app = types.ModuleType('bpy.app')
+    bpy.app.__path__ = []
+    bpy.app.__dict__.update(handlers=handlers_module, timers=_Timers(), version=(4, 2, 0),
+                           version_string='4.2.0 (fake)', background=True)
+    bpy.ops = _Ops()
+    bpy.msgbus = types.SimpleNamespace(subscribe_rna=lambda **kw: None, clear_by_owner=lambda owner: None)
+    bpy.data = types.SimpleNamespace(materials=DataCollection(), node_groups=DataCollection(),
+                                     scenes=DataCollection(), worlds=DataCollection(),
+                                     lights=DataCollection(), texts=DataCollection())
+    bpy.context = types.SimpleNamespace(
+        window_manager=types.SimpleNamespace(keyconfigs=types.SimpleNamespace(addon=None)))
+
+    presets = types.ModuleType('bl_operators.presets')
+    presets.AddPresetBase = type('AddPresetBase', (), {})
+    bl_operators = types.ModuleType('bl_operators')
+    bl_operators.__path__ = []
+    bl_operators.presets = presets
+
+    io_utils = types.ModuleType('bpy_extras.io_utils')
+    io_utils.ExportHelper = type('ExportHelper', (), {'filepath': ''})
+    io_utils.ImportHelper = type('ImportHelper', (), {'filepath': ''})
+    bpy_extras = types.ModuleType('bpy_extras')
+    bpy_extras.__path__ = []
+    bpy_extras.io_utils = io_utils
+
+    sys.modules['bpy_extras'] = bpy_extras
+    sys.modules['bpy_extras.io_utils'] = io_utils
+    sys.modules['bpy'] = bpy
+    sys.modules['bpy.types'] = bpy.types
+    sys.modules['bpy.app'] = bpy.app
+    sys.modules['bpy.app.handlers'] = handlers_module
+    sys.modules['bl_operators'] = bl_operators
+    sys.modules['bl_operators.presets'] = presets
+    return bpy
@@ -0,0 +1,293 @@
+"""Headless benchmarks of the add-on under plain CPython (no Blender).
+
+    python benchmarks/run_benchmarks.py [--sizes 10 100 1000 10000] [--repeat 5] [--output bench.json]
+
+Trees with the requested frame counts are generated on the `fake_bpy` stand-in,
+then panel draws, `frames_list`, walks, reorders, focus and the batch color
+operators are timed. Results are printed (or written) as JSON so runs of
+different versions can be compared.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, HERE)
+
+import fake_bpy
+
+bpy = fake_bpy.install()
+
+WORDS = ("light", "shadow", "mask", "color", "output", "noise", "ramp", "bump",
+         "mix", "group", "texture", "uv", "fresnel", "glass", "emission", "detail")
+
+
+def load_addon():
+    spec = importlib.util.spec_from_file_location(
+        'frame_focus', os.path.join(ROOT, '__init__.py'), submodule_search_locations=[ROOT])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules['frame_focus'] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return addon
+
+
+def addon_version():
+    with open(os.path.join(ROOT, 'blender_manifest.toml')) as f:
+        for line in f:
+            if line.startswith('version'):
+                return line.split('=', 1)[1].strip().strip('"')
+    return None
+
+
+# [ Scene ]
+def build_tree(frame_count, nodes_per_frame=2, seed=0):
+    rng = random.Random(seed)
+    tree = fake_bpy.NodeTree(f"Tree_{frame_count}")
+    Nodes = tree.nodes
+    columns = max(1, int(frame_count ** 0.5))
+    frames = []
+    for i in range(frame_count):
+        fm = Nodes.new('NodeFrame')
+        fm.name = f"fm_{i}"
+        fm.label = f"{rng.choice(WORDS)} {rng.choice(WORDS)} {i}"
+        fm.color = (rng.random(), rng.random(), rng.random())
+        fm.use_custom_color = rng.random() < 0.5
+        fm.shrink = rng.random() < 0.5
+        fm.select = rng.random() < 0.1
+        fm.location = ((i % columns) * 600.0, -(i // columns) * 500.0)
+        fm.dimensions = fake_bpy.Vector((500.0, 400.0))
+        if i % 10 == 9:
+            fm.parent = frames[-1]
+        frames.append(fm)
+        for j in range(nodes_per_frame):
+            nd = Nodes.new('ShaderNodeMix')
+            nd.parent = fm
+            nd.location = (20.0 + j * 160.0, -40.0)
+            nd.select = rng.random() < 0.1
+    return tree
+
+
+def build_context(addon, tree):
+    scene = type('Scene', (), {})()
+    scene.name = 'Scene'
+    scene.world = None
+    scene.frame_focus = fake_bpy.PropertyGroupInstance(addon.frame_functions.FRAMEFOCUS_Props)
+    scene.frame_color = fake_bpy.PropertyGroupInstance(addon.color_functions.FRAMEFOCUS_ColorEdit_Props)
+    context = fake_bpy.Context(tree, scene)
+    fake_bpy.set_context(context)
+    return context
+
+
+# [ Benchmarks ]
+def run_operator(cls, context, **props):
+    op = cls()
+    for key, value in props.items():
+        setattr(op, key, value)
+    return op.execute(context)
+
+
+def draw_panel(cls, context):
+    panel = cls()
+    if hasattr(cls, 'poll') and not cls.poll(context):
+        return 0
+    panel.draw(context)
+    return panel.layout.counter[0]
+
+
+def benchmarks(addon, context):
+    ff = addon.frame_functions
+    cf = addon.color_functions
+    cache = addon.frame_cache
+    props = context.scene.frame_focus
+
+    def set_panel_mode(mode, list_view=False):
+        props.panel_mode = str(mode)
+        props._idprops['panel_mode'] = mode
+        props.use_list_view = list_view
+
+    def cold_frames_list():
+        cache.clear()
+        ff.frames_list(context)
+
+    def draw(mode, list_view=False):
+        def bench():
+            set_panel_mode(mode, list_view)
+            return draw_panel(ff.FRAMEFOCUS_PT_Main, context) + draw_panel(ff.FRAMEFOCUS_PT_Frame_Bar, context)
+        return bench
+
+    def with_order(mode, func):
+        def bench():
+            props.order_mode = mode
+            return func()
+        return bench
+
+    yield 'frames_list_cold', cold_frames_list
+    yield 'frames_list_warm', lambda: ff.frames_list(context)
+    yield 'draw_panels_none', draw(0)
+    yield 'draw_panels_look', draw(1)
+    yield 'draw_panels_word', draw(2)
+    yield 'draw_panels_list_view', draw(0, True)
+
+    def draw_after(change):
+        bench_draw = draw(0)
+        def bench():
+            change()
+            return bench_draw()
+        return bench
+
+    tree_update = types.SimpleNamespace(updates=[types.SimpleNamespace(
+        id=types.SimpleNamespace(original=context.space_data.edit_tree))])
+    yield 'draw_after_link_edit', draw_after(lambda: cache._on_depsgraph_update(context.scene, tree_update))
+
+    def label_edit():
+        Frame = cache.context_index(context).frames[0]
+        Frame.label = Frame.label + '_' if len(Frame.label) < 40 else Frame.label[:8]
+        cache._on_depsgraph_update(context.scene, tree_update)
+
+    yield 'draw_after_label_edit', draw_after(label_edit)
+
+    def select_click():
+        Frame = cache.context_index(context).frames[0]
+        Frame.select = not Frame.select
+
+    yield 'draw_after_select', draw_after(select_click)
+
+    for mode in ('NAME', 'KEY'):
+        for walk_type in ('WALK_UP', 'WALK_DOWN', 'TO_TOP', 'TO_BOTTOM'):
+            yield f'walk_{walk_type.lower()}_{mode.lower()}', with_order(
+                mode, lambda walk_type=walk_type: run_operator(ff.FRAMEFOCUS_OT_Walk, context, walk_type=walk_type))
+        for key, name in (('0', 'label'), ('1', 'hue'), ('2', 'reverse'),
+                          ('3', 'lightness'), ('4', 'lab_hue'), ('5', 'palette')):
+            yield f'reorder_{name}_{mode.lower()}', with_order(
+                mode, lambda key=key: run_operator(ff.FRAMEFOCUS_OT_Reorder, context, useType=key))
+    props.order_mode = 'NAME'
+
+    def deferred_walks(clicks=20):
+        def bench():
+            props.use_deferred_order = True
+            for _ in range(clicks):
+                run_operator(ff.FRAMEFOCUS_OT_Walk, context, walk_type='WALK_DOWN')
+            bpy.app.timers.run()
+            props.use_deferred_order = False
+        return bench
+
+    yield 'walk_down_x20_deferred', deferred_walks()
+
+    def focus_first():
+        index = cache.context_index(context)
+        run_operator(ff.FRAMEFOCUS_OT_Focus, context, frame=index.sorted_names[0])
+
+    yield 'focus', focus_first
+    yield 'focus_selected', lambda: run_operator(ff.FRAMEFOCUS_OT_Focus, context, use_selected=True)
+
+    for frames_only in (True, False):
+        suffix = 'frames' if frames_only else 'all_nodes'
+
+        def color_op(cls, frames_only=frames_only, **kwargs):
+            def bench():
+                context.scene.frame_color.frames_only = frames_only
+                run_operator(cls, context, **kwargs)
+            return bench
+
+        yield f'set_color_{suffix}', color_op(cf.FRAMEFOCUS_OT_Color_Set, setColor=[0.4, 0.08, 0.08])
+        yield f'color_set_default_{suffix}', color_op(cf.FRAMEFOCUS_OT_Color_Set_Default)
+        yield f'color_enabled_{suffix}', color_op(cf.FRAMEFOCUS_OT_Color_Enabled, use_custom_color=True)
+    yield 'quantize_all', lambda: run_operator(cf.FRAMEFOCUS_OT_Quantize, context, use_all=True)
+    yield 'quantize_cluster', lambda: run_operator(cf.FRAMEFOCUS_OT_Quantize, context, use_all=True, cluster=True)
+    snapshot = addon.frame_snapshot.take_snapshot(context.space_data.edit_tree, cache.context_index(context))
+    yield 'snapshot_take', lambda: addon.frame_snapshot.take_snapshot(
+        context.space_data.edit_tree, cache.context_index(context))
+    yield 'snapshot_apply', lambda: addon.frame_snapshot.apply_snapshot(
+        context.space_data.edit_tree, cache.context_index(context), snapshot, 'LABEL')
+
+    def member_counts():
+        cache.invalidate(context.space_data.edit_tree)
+        return cache.context_index(context).member_counts(context.space_data.edit_tree)
+
+    def members(action):
+        def bench():
+            index = cache.context_index(context)
+            run_operator(ff.FRAMEFOCUS_OT_Members, context, action=action, frame=index.roots[0])
+        return bench
+
+    yield 'member_counts', member_counts
+    yield 'members_select', members('SELECT')
+    yield 'members_mute', members('MUTE')
+    yield 'batch_use_custom_color', lambda: run_operator(ff.FRAMEFOCUS_OT_Batch_UseCustomColor, context)
+    yield 'batch_shrink', lambda: run_operator(ff.FRAMEFOCUS_OT_Batch_Shrink, context)
+
+
+def time_call(func, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    entry = {
+        'min_ms': round(min(samples), 4),
+        'median_ms': round(statistics.median(samples), 4),
+        'mean_ms': round(statistics.fmean(samples), 4),
+        'runs': repeat,
+    }
+    if isinstance(result, int):
+        entry['ui_items'] = result
+    return entry
+
+
+def run(sizes, repeat, nodes_per_frame, only=None):
+    addon = load_addon()
+    results = {}
+    for size in sizes:
+        tree = build_tree(size, nodes_per_frame)
+        context = build_context(addon, tree)
+        addon.frame_cache.clear()
+        size_results = {'nodes': len(tree.nodes)}
+        for name, func in benchmarks(addon, context):
+            if only and not any(pattern in name for pattern in only):
+                continue
+            size_results[name] = time_call(func, repeat)
+        results[str(size)] = size_results
+    addon.unregister()
+    return {
+        'meta': {
+            'addon_version': addon_version(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': repeat,
+            'nodes_per_frame': nodes_per_frame,
+        },
+        'results': results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--nodes-per-frame', type=int, default=2)
+    parser.add_argument('--only', nargs='+', help='run benchmarks whose name contains one of these')
+    parser.add_argument('--output', help='write the JSON report to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.repeat, args.nodes_per_frame, args.only)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+import bpy
+import json
+from functools import partial
+from .frame_cache import cached_index, order_mode
+
+
+# [ Blend-Wide Index ]
+TREE_ICONS = {
+    'MATERIAL':'MATERIAL',
+    'NODE_GROUP':'NODETREE',
+    'SCENE':'SCENE_DATA',
+    'WORLD':'WORLD',
+    'LIGHT':'LIGHT',
+}
+
+def tree_owners():
+    """(kind, owner, tree) of every node tree in bpy.data"""
+    for mat in bpy.data.materials:
+        if mat.node_tree:
+            yield 'MATERIAL', mat, mat.node_tree
+    for grp in bpy.data.node_groups:
+        yield 'NODE_GROUP', grp, grp
+    for scene in bpy.data.scenes:
+        # Blender 5 compositing trees are node groups, already listed above
+        tree = getattr(scene, 'node_tree', None)
+        if tree:
+            yield 'SCENE', scene, tree
+    for world in bpy.data.worlds:
+        if world.node_tree:
+            yield 'WORLD', world, world.node_tree
+    for light in bpy.data.lights:
+        if light.node_tree:
+            yield 'LIGHT', light, light.node_tree
+
+
+def owner_data(kind):
+    return {
+        'MATERIAL':bpy.data.materials,
+        'NODE_GROUP':bpy.data.node_groups,
+        'SCENE':bpy.data.scenes,
+        'WORLD':bpy.data.worlds,
+        'LIGHT':bpy.data.lights,
+    }[kind]
+
+
+# Entries per tree pointer, kept while the tree's frame index is unchanged
+_entries = {}
+
+def blend_frames(mode='NAME'):
+    """(kind, owner name, frame name, label) of every frame in the file"""
+    result = []
+    seen = set()
+    for kind, owner, tree in tree_owners():
+        key = tree.as_pointer()
+        seen.add(key)
+        index = cached_index(tree, mode)
+        cached = _entries.get(key)
+        if cached is None or cached[0] is not index:
+            items = [(kind, owner.name, fm.name, fm.label) for fm in index.sorted]
+            cached = _entries[key] = (index, items)
+        result.extend(cached[1])
+    for key in _entries.keys() - seen:
+        del _entries[key]
+    return result
+
+
+def clear():
+    _entries.clear()
+
+
+# [ Open Tree ]
+def open_tree(context, kind, owner):
+    """Show the tree of `owner` in the node editor of `context`.
+
+    The tree is pinned to the editor: the active object, material slot and
+    world are left as they are.
+    """
+    space = context.space_data
+    tree = owner if kind == 'NODE_GROUP' else owner.node_tree
+    if space.edit_tree == tree:
+        return tree
+    space.tree_type = tree.bl_idname
+    space.pin = True
+    space.node_tree = tree
+    return tree
+
+
+def _deferred_focus(window, area, frame):
+    # The frame is focused once the editor has drawn the new tree (dimensions are valid)
+    if area.type != 'NODE_EDITOR':
+        return None
+    region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+    with bpy.context.temp_override(window=window, area=area, region=region):
+        bpy.ops.frame_focus.frame_focus(frame=frame)
+    return None
+
+
+# [ Operator ]
+_search_items = []
+
+def search_items(self, context):
+    _search_items.clear()
+    for kind, owner, name, label in blend_frames(order_mode(context)):
+        identifier = json.dumps([kind, owner, name])
+        text = f"{label or name}  ·  {owner}"
+        _search_items.append((identifier, text, name, TREE_ICONS[kind], len(_search_items)))
+    return _search_items
+
+
+class FRAMEFOCUS_OT_Blend_Search(bpy.types.Operator):
+    """Search Frames In All Node Trees Of The File"""
+    bl_idname = "frame_focus.blend_search"
+    bl_label = "Search All Frames"
+    bl_property = "target"
+    target : bpy.props.EnumProperty(items=search_items)
+
+    @classmethod
+    def poll(cls, context):
+        return context.space_data and context.space_data.type == 'NODE_EDITOR'
+
+    def execute(self, context):
+        kind, owner_name, frame = json.loads(self.target)
+        owner = owner_data(kind).get(owner_name)
+        if owner is None:
+            self.report({'WARNING'}, f"{owner_name} no longer exists")
+            return {'CANCELLED'}
+        open_tree(context, kind, owner)
+        bpy.app.timers.register(partial(_deferred_focus, context.window, context.area, frame),
+                                first_interval=0.1)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.invoke_search_popup(self)
+        return {'RUNNING_MODAL'}
+
+
+classes = (
+    FRAMEFOCUS_OT_Blend_Search,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
+    clear()
@@ -1,8 +1,12 @@
 import bpy
-import json
-import os
+import numpy as np
 from bpy.types import Panel, Operator, Menu, PropertyGroup
-from bl_operators.presets import AddPresetBase
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from . import palette_library
+from .frame_cache import context_index, order_mode
+from .frame_core import node_scope, set_colors, set_custom_color, set_default_colors
+from .node_bulk import finish_batch, read_colors, read_flags, write_color_rows
+from .color_math import kmeans, lab_to_rgb, nearest, rgb_to_lab
 
 # Color Set
 preset_colors = [
@@ -29,26 +33,102 @@ class FRAMEFOCUS_ColorEdit_Props(bpy.types.PropertyGroup):
     color_8 : define_color_prop(8)
     color_9 : define_color_prop(9)
 
+    palette_name : bpy.props.StringProperty(name='Palette',default='')
     open_perference : bpy.props.BoolProperty(name='Open Preference',default=False)
     frames_only : bpy.props.BoolProperty(name='use all node',default=True)
 
 
-# [ Preset ]
-#  --- Preset ---
-class FRAMEFOCUS_MT_Palette_Preset(Menu):
-    bl_label = "Focus Color Settings"
-    preset_subdir = "scene/frame_color"
-    preset_operator = "script.execute_preset"
-    draw = Menu.draw_preset
+# [ Palette Library ]
+def palette_colors(Props):
+    return [tuple(getattr(Props,f'color_{i}')) for i in range(1,10)]
 
-class FRAMEFOCUS_OT_Palette_Preset(AddPresetBase, bpy.types.Operator):
-    """Palette Preset Add & Remove"""
-    bl_idname = "frame_color.palette"
-    bl_label = "Palette Presets"
-    preset_menu = "FRAMEFOCUS_MT_Palette_Preset"
-    preset_defines = ["frame_color = bpy.context.scene.frame_color"]
-    preset_values = [f"frame_color.color_{str(i)}" for i in range(1,10)]
-    preset_subdir = "scene/frame_color"
+class FRAMEFOCUS_MT_Palette_Library(Menu):
+    bl_label = "Palettes"
+    def draw(self, context):
+        Layout = self.layout
+        names = palette_library.palette_names()
+        if not names:
+            Layout.label(text='No Palettes Saved',icon='INFO')
+        for name in names:
+            Layout.operator("frame_color.palette_apply",text=name).name = name
+        Layout.separator()
+        Layout.operator("frame_color.palette_import",icon='IMPORT')
+        Layout.operator("frame_color.palette_export",icon='EXPORT')
+
+class FRAMEFOCUS_OT_Palette_Apply(bpy.types.Operator):
+    """Load The Palette Colors"""
+    bl_idname = "frame_color.palette_apply"
+    bl_label = "Apply Palette"
+    name : bpy.props.StringProperty(default='')
+    def execute(self, context):
+        Props = context.scene.frame_color
+        try:
+            colors = palette_library.load_palette(self.name)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'WARNING'}, f"Cannot read palette {self.name}: {error}")
+            return {'CANCELLED'}
+        for i,Color in enumerate(colors,1):
+            setattr(Props,f'color_{i}',Color)
+        Props.palette_name = self.name
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Palette_Add(bpy.types.Operator):
+    """Save The Current Colors As A Palette"""
+    bl_idname = "frame_color.palette_add"
+    bl_label = "Save Palette"
+    name : bpy.props.StringProperty(name='Name',default='Palette')
+    def execute(self, context):
+        Props = context.scene.frame_color
+        if not palette_library.clean_name(self.name):
+            return {'CANCELLED'}
+        palette_library.save_palette(self.name, palette_colors(Props))
+        Props.palette_name = palette_library.clean_name(self.name)
+        return {'FINISHED'}
+    def invoke(self, context, event):
+        self.name = context.scene.frame_color.palette_name or 'Palette'
+        return context.window_manager.invoke_props_dialog(self)
+
+class FRAMEFOCUS_OT_Palette_Remove(bpy.types.Operator):
+    """Delete The Active Palette From The Library"""
+    bl_idname = "frame_color.palette_remove"
+    bl_label = "Remove Palette"
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.frame_color.palette_name)
+    def execute(self, context):
+        Props = context.scene.frame_color
+        if not palette_library.remove_palette(Props.palette_name):
+            return {'CANCELLED'}
+        Props.palette_name = ''
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Palette_Export(bpy.types.Operator, ExportHelper):
+    """Save All Palettes Of The Library To One JSON File"""
+    bl_idname = "frame_color.palette_export"
+    bl_label = "Export Palette Pack"
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    def execute(self, context):
+        count = palette_library.export_pack(self.filepath)
+        self.report({'INFO'}, f"{count} palette(s) exported")
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Palette_Import(bpy.types.Operator, ImportHelper):
+    """Add The Palettes Of A JSON Palette Pack (Or An Old Python Preset) To The Library"""
+    bl_idname = "frame_color.palette_import"
+    bl_label = "Import Palette Pack"
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json;*.py", options={'HIDDEN'})
+    overwrite : bpy.props.BoolProperty(name='Overwrite', default=False,
+                                       description='Replace palettes that already exist with the same name')
+    def execute(self, context):
+        try:
+            added, skipped = palette_library.import_pack(self.filepath, self.overwrite)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, f"Cannot import {self.filepath}: {error}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"{added} palette(s) imported, {skipped} skipped")
+        return {'FINISHED'}
 
 class FRAMEFOCUS_OT_Palette_Reset(bpy.types.Operator):
     """Reset Color Set"""
@@ -67,53 +147,90 @@ class FRAMEFOCUS_OT_Palette_Reset(bpy.types.Operator):
         Props.color_9 = [0.3,0.3,0.3]
         return {'FINISHED'}
 
-def node_list(context,frame_only):
+def edit_tree(context):
+    """Node tree of the editor, None when there is nothing to edit"""
     Tree = context.space_data.edit_tree
-    if not Tree:
-        return None
-    Nodes = Tree.nodes
-    if not Nodes:
+    if not Tree or not Tree.nodes:
         return None
-    if not frame_only:
-        return [ nd for nd in Nodes if nd.select]
-    return [ nd for nd in Nodes if nd.select and nd.type=='FRAME']
+    return Tree
 
 #[ Operator ]
 class FRAMEFOCUS_OT_Color_Set_Default(bpy.types.Operator):
     """Reset Selected Frames Color To Default"""
     bl_idname = "frame_color.color_set_default"
     bl_label = "Set Default Color"
+    bl_options = {'UNDO'}
     def execute(self, context):
         colorEditor = context.scene.frame_color
-        Nodes = node_list(context,colorEditor.frames_only)
-        for nd in Nodes:
-            nd.color = [0.327964, 0.327964, 0.327964]#[0.188, 0.188, 0.188]
-        return {'FINISHED'}
+        Tree = edit_tree(context)
+        if Tree is None:
+            return {'CANCELLED'}
+        count = set_default_colors(Tree, colorEditor.frames_only, order_mode=order_mode(context))#[0.188, 0.188, 0.188]
+        return finish_batch(self, context, count)
 
 class FRAMEFOCUS_OT_Color_Enabled(bpy.types.Operator):
     """Selected Nodes (Not) Use Custom Color"""
     bl_idname = "frame_color.color_enabled"
     bl_label = "Node\'s Color Enable"
+    bl_options = {'UNDO'}
     use_custom_color : bpy.props.BoolProperty(default=True)
     def execute(self, context):
         colorEditor = context.scene.frame_color
-        Nodes = node_list(context,colorEditor.frames_only)
-        for nd in Nodes:
-            nd.use_custom_color = self.use_custom_color
-        return {'FINISHED'}
+        Tree = edit_tree(context)
+        if Tree is None:
+            return {'CANCELLED'}
+        count = set_custom_color(Tree, self.use_custom_color, colorEditor.frames_only, order_mode=order_mode(context))
+        return finish_batch(self, context, count)
     
 
 class FRAMEFOCUS_OT_Color_Set(bpy.types.Operator):
     """Set Selected Nodes Color"""
     bl_idname = "frame_color.set_color"
     bl_label = "Set Color "
+    bl_options = {'UNDO'}
     setColor : bpy.props.FloatVectorProperty(default=[0,0,0])
     def execute(self, context):
         colorEditor = context.scene.frame_color
-        Nodes = node_list(context,colorEditor.frames_only)
-        for nd in Nodes:
-            nd.color = self.setColor
-        return {'FINISHED'}
+        Tree = edit_tree(context)
+        if Tree is None:
+            return {'CANCELLED'}
+        count = set_colors(Tree, self.setColor, colorEditor.frames_only, order_mode=order_mode(context))
+        return finish_batch(self, context, count)
+
+class FRAMEFOCUS_OT_Quantize(bpy.types.Operator):
+    """Snap Node Colors To The Nearest Palette Color (CIELAB)"""
+    bl_idname = "frame_color.quantize"
+    bl_label = "Snap To Palette"
+    bl_options = {'REGISTER', 'UNDO'}
+    use_all : bpy.props.BoolProperty(name='All', default=False,
+                                     description='Use every frame (or node) of the tree, not only the selected ones')
+    custom_only : bpy.props.BoolProperty(name='Custom Colors Only', default=True,
+                                         description='Skip nodes that do not use a custom color')
+    cluster : bpy.props.BoolProperty(name='Cluster Palette', default=False,
+                                     description='Replace the palette with 9 clusters of the current colors first')
+    def execute(self, context):
+        colorEditor = context.scene.frame_color
+        Tree = context.space_data.edit_tree
+        if not Tree:
+            return {'CANCELLED'}
+        Nodes = Tree.nodes
+        index = context_index(context)
+        mask = node_scope(Tree,index,colorEditor.frames_only,not self.use_all)
+        if self.custom_only:
+            mask &= read_flags(Nodes,'use_custom_color')
+        if not mask.any():
+            return finish_batch(self, context, 0)
+
+        lab = rgb_to_lab(read_colors(Nodes)[mask])
+        if self.cluster:
+            palette = lab_to_rgb(kmeans(lab,9))
+            for i,Color in enumerate(palette,1):
+                setattr(colorEditor,f'color_{i}',Color)
+        else:
+            palette = np.array([getattr(colorEditor,f'color_{i}') for i in range(1,10)])
+        rows = palette[nearest(lab,rgb_to_lab(palette))]
+        count = write_color_rows(Tree, mask, rows)
+        return finish_batch(self, context, count)
 
 # Color Set Panel
 class FRAMEFOCUS_OT_Color_panel(bpy.types.Operator):
@@ -132,9 +249,9 @@ class FRAMEFOCUS_OT_Color_panel(bpy.types.Operator):
         Props = context.scene.frame_color
         # Preset 
         Preset_row = Layout.row(align=True)
-        Preset_row.menu(FRAMEFOCUS_MT_Palette_Preset.__name__,text =FRAMEFOCUS_MT_Palette_Preset.bl_label)
-        Preset_row.operator(FRAMEFOCUS_OT_Palette_Preset.bl_idname, text="", icon='ZOOM_IN')
-        Preset_row.operator(FRAMEFOCUS_OT_Palette_Preset.bl_idname, text="", icon='ZOOM_OUT').remove_active = True
+        Preset_row.menu(FRAMEFOCUS_MT_Palette_Library.__name__,text =Props.palette_name or FRAMEFOCUS_MT_Palette_Library.bl_label)
+        Preset_row.operator("frame_color.palette_add", text="", icon='ZOOM_IN')
+        Preset_row.operator("frame_color.palette_remove", text="", icon='ZOOM_OUT')
         Preset_row.operator("frame_color.palette_reset",text='',icon='LOOP_BACK')
         
         # Frames Only
@@ -161,6 +278,16 @@ class FRAMEFOCUS_OT_Color_panel(bpy.types.Operator):
             btn_setColor =col.operator("frame_color.set_color",icon='EYEDROPPER')
             btn_setColor.setColor=Color
         
+        # Quantize
+        Layout.separator(factor=1.0,type='LINE')
+        row_quant = Layout.row(align=True)
+        row_quant.operator("frame_color.quantize",icon='SNAP_ON')
+        op = row_quant.operator("frame_color.quantize",text='All',icon='SNAP_ON')
+        op.use_all = True
+        op = row_quant.operator("frame_color.quantize",text='Cluster',icon='COLOR')
+        op.use_all = True
+        op.cluster = True
+
         # Clear Color
         pie_cleanColor = Layout.menu_pie()
         pie_cleanColor.alignment = 'RIGHT'
@@ -168,12 +295,17 @@ class FRAMEFOCUS_OT_Color_panel(bpy.types.Operator):
 
 
 classes = [
-    FRAMEFOCUS_MT_Palette_Preset,
-    FRAMEFOCUS_OT_Palette_Preset,
+    FRAMEFOCUS_MT_Palette_Library,
+    FRAMEFOCUS_OT_Palette_Apply,
+    FRAMEFOCUS_OT_Palette_Add,
+    FRAMEFOCUS_OT_Palette_Remove,
+    FRAMEFOCUS_OT_Palette_Export,
+    FRAMEFOCUS_OT_Palette_Import,
     FRAMEFOCUS_OT_Palette_Reset,
     FRAMEFOCUS_OT_Color_Set_Default,
     FRAMEFOCUS_OT_Color_Enabled,
     FRAMEFOCUS_OT_Color_Set,
+    FRAMEFOCUS_OT_Quantize,
     FRAMEFOCUS_OT_Color_panel, 
     ]
 
@@ -186,5 +318,6 @@ def register():
 def unregister():
     for cls in classes:
         bpy.utils.unregister_class(cls)
+    palette_library.clear()
     del bpy.types.Scene.frame_color
     bpy.utils.unregister_class(FRAMEFOCUS_ColorEdit_Props)
@@ -0,0 +1,74 @@
+# Vectorized color conversions for (n, 3) arrays of node colors.
+# Node and palette colors are gamma (sRGB) encoded, CIELAB uses the D65 white point.
+import numpy as np
+
+_RGB_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+_XYZ_TO_RGB = np.linalg.inv(_RGB_TO_XYZ)
+_WHITE = np.array([0.95047, 1.0, 1.08883])
+_EPSILON = 216.0 / 24389.0
+_KAPPA = 24389.0 / 27.0
+
+
+def srgb_to_linear(rgb):
+    rgb = np.clip(np.asarray(rgb, dtype=np.float64), 0.0, 1.0)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(rgb):
+    rgb = np.clip(np.asarray(rgb, dtype=np.float64), 0.0, 1.0)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1.0 / 2.4) - 0.055)
+
+
+def rgb_to_lab(rgb):
+    xyz = srgb_to_linear(rgb).reshape(-1, 3) @ _RGB_TO_XYZ.T / _WHITE
+    f = np.where(xyz > _EPSILON, np.cbrt(xyz), (_KAPPA * xyz + 16.0) / 116.0)
+    L = 116.0 * f[:, 1] - 16.0
+    a = 500.0 * (f[:, 0] - f[:, 1])
+    b = 200.0 * (f[:, 1] - f[:, 2])
+    return np.stack([L, a, b], axis=1)
+
+
+def lab_to_rgb(lab):
+    lab = np.asarray(lab, dtype=np.float64).reshape(-1, 3)
+    fy = (lab[:, 0] + 16.0) / 116.0
+    fx = fy + lab[:, 1] / 500.0
+    fz = fy - lab[:, 2] / 200.0
+    f = np.stack([fx, fy, fz], axis=1)
+    xyz = np.where(f ** 3 > _EPSILON, f ** 3, (116.0 * f - 16.0) / _KAPPA) * _WHITE
+    return linear_to_srgb(xyz @ _XYZ_TO_RGB.T)
+
+
+def nearest(lab, palette_lab):
+    """Index of the closest palette entry (squared Lab distance) for every row"""
+    d = ((lab[:, None, :] - palette_lab[None, :, :]) ** 2).sum(axis=2)
+    return d.argmin(axis=1)
+
+
+def kmeans(lab, k, iterations=20, seed=0):
+    """Cluster Lab rows into at most `k` centers (k-means++ start), sorted by lightness"""
+    lab = np.asarray(lab, dtype=np.float64)
+    unique = np.unique(np.round(lab, 3), axis=0)
+    k = min(k, len(unique))
+    if k == 0:
+        return np.empty((0, 3))
+    rng = np.random.default_rng(seed)
+    centers = [unique[rng.integers(len(unique))]]
+    for _ in range(1, k):
+        d = ((unique[:, None, :] - np.array(centers)[None, :, :]) ** 2).sum(axis=2).min(axis=1)
+        centers.append(unique[rng.choice(len(unique), p=d / d.sum())] if d.sum() > 0 else unique[0])
+    centers = np.array(centers)
+
+    for _ in range(iterations):
+        labels = nearest(lab, centers)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centers)
+        np.add.at(sums, labels, lab)
+        moved = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centers)
+        if np.allclose(moved, centers):
+            break
+        centers = moved
+    return centers[np.argsort(centers[:, 0], kind='stable')]
@@ -0,0 +1,417 @@
+import bpy
+import numpy as np
+import uuid
+from bpy.app.handlers import persistent
+
+# Custom property holding a frame's position in 'KEY' order mode
+ORDER_KEY = "frame_focus_order"
+# Custom property holding an add-on assigned ID that survives renames
+ID_KEY = "frame_focus_id"
+
+
+# [ Frame Index ]
+class FrameIndex:
+    """Frame nodes of one node tree, collected in a single pass over `tree.nodes`"""
+    def __init__(self, tree, stamp, selection, order_mode='NAME'):
+        self.stamp = stamp
+        self.order_mode = order_mode
+        self.frames = []
+        self.positions = []
+        for i, nd in enumerate(tree.nodes):
+            if nd.type == 'FRAME':
+                self.frames.append(nd)
+                self.positions.append(i)
+
+        self.names = [fm.name for fm in self.frames]
+        self.labels = [fm.label for fm in self.frames]
+        self.texts = [fm.text.name if fm.text else '' for fm in self.frames]
+        self.shrink = [fm.shrink for fm in self.frames]
+        self.use_custom_color = [fm.use_custom_color for fm in self.frames]
+        self.by_name = dict(zip(self.names, self.frames))
+        self.position_of = dict(zip(self.names, self.positions))
+
+        if order_mode == 'KEY':
+            # Frames without a key follow the keyed ones, by name
+            self.keys = [fm.get(ORDER_KEY) for fm in self.frames]
+            def sort_key(i):
+                k = self.keys[i]
+                return (k is None, k if k is not None else 0, self.names[i])
+        else:
+            self.keys = None
+            sort_key = self.names.__getitem__
+        self.order = sorted(range(len(self.frames)), key=sort_key)
+        self.sorted = [self.frames[i] for i in self.order]
+        self.sorted_names = [self.names[i] for i in self.order]
+
+        # Frame nesting: parent frame name -> child frame names, in list order
+        self.children = {}
+        self.roots = []
+        self.parents = [fm.parent for fm in self.sorted]
+        for fm, parent in zip(self.sorted, self.parents):
+            if parent is not None and parent.name in self.by_name:
+                self.children.setdefault(parent.name, []).append(fm.name)
+            else:
+                self.roots.append(fm.name)
+
+        self.has_frame = len(self.frames) > 0
+        self.set_selection(selection)
+        self._list_filter = {}
+        self._hierarchy_rows = None
+        self._members = None
+        self._member_counts = None
+        self._member_locations = None
+        self.members_stale = False
+
+    def __len__(self):
+        return len(self.frames)
+
+    def set_selection(self, selection):
+        """Update the selection columns from the select flags of all nodes (a bool array, see _selection).
+
+        Selecting in the editor only changes these, the rest of the index is kept.
+        """
+        self.selection = selection.tobytes()
+        self.select = selection[self.positions].tolist()
+        order = self.order
+        self.selected = [self.frames[i] for i in order if self.select[i]]
+        self.selected_names = [self.names[i] for i in order if self.select[i]]
+        self.selected_positions = [self.positions[i] for i in order if self.select[i]]
+        self.any_selected = len(self.selected) > 0
+        self.all_custom_color = all(c for c, s in zip(self.use_custom_color, self.select) if s)
+        self.all_shrink = all(sh for sh, s in zip(self.shrink, self.select) if s)
+
+    def _check_members(self, tree):
+        # Only when the member data is used after a change: a node dropped into a
+        # frame changes its parent, and its location with it (relative to the parent)
+        if self.members_stale:
+            self.members_stale = False
+            if self._members is not None and _locations(tree) != self._member_locations:
+                self._members = None
+                self._member_counts = None
+
+    def branch(self, name):
+        """`name` and all frames nested in it, depth first"""
+        result = []
+        stack = [name]
+        while stack:
+            fm = stack.pop()
+            result.append(fm)
+            stack.extend(reversed(self.children.get(fm, ())))
+        return result
+
+    def visible_rows(self, expanded, order=None):
+        """(name, depth) of the frames shown when only `expanded` branches are open.
+
+        Siblings follow `order` (frame names in list order) when given, the stored order otherwise.
+        """
+        rank = None if order is None else {name: i for i, name in enumerate(order)}
+        def siblings(names):
+            return names if rank is None else sorted(names, key=rank.__getitem__)
+        rows = []
+        stack = [(name, 0) for name in reversed(siblings(self.roots))]
+        while stack:
+            name, depth = stack.pop()
+            rows.append((name, depth))
+            if name in expanded:
+                stack.extend((child, depth + 1) for child in reversed(siblings(self.children.get(name, ()))))
+        return rows
+
+    def hierarchy_rows(self, expanded_pointers, order=None, order_key=None):
+        """(names, depth by name) of visible_rows for the frames whose pointers are in `expanded_pointers`.
+
+        Cached until the open branches or `order_key` (identifies `order`) change.
+        """
+        key = (frozenset(expanded_pointers), order_key)
+        cached = self._hierarchy_rows
+        if cached is None or cached[0] != key:
+            open_names = {name for name in self.children if self.by_name[name].as_pointer() in expanded_pointers}
+            rows = self.visible_rows(open_names, order)
+            cached = self._hierarchy_rows = (key, [name for name, _ in rows], dict(rows))
+        return cached[1], cached[2]
+
+    def direct_members(self, tree):
+        """Frame name -> positions in `tree.nodes` of the nodes parented to it, one pass, built on first use"""
+        self._check_members(tree)
+        if self._members is None:
+            members = {}
+            for i, nd in enumerate(tree.nodes):
+                parent = nd.parent
+                if parent is not None:
+                    members.setdefault(parent.name, []).append(i)
+            self._members = members
+            self._member_locations = _locations(tree)
+        return self._members
+
+    def member_positions(self, tree, names):
+        """Sorted positions of every node inside the frames `names`, nested frames included"""
+        members = self.direct_members(tree)
+        found = set()
+        for name in names:
+            for fm in self.branch(name):
+                found.update(members.get(fm, ()))
+        return sorted(found)
+
+    def member_counts(self, tree):
+        """Frame name -> number of (non-frame) nodes inside it, nested frames included"""
+        self._check_members(tree)
+        if self._member_counts is None:
+            members = self.direct_members(tree)
+            is_frame = set(self.positions)
+            own = {fm: sum(1 for pos in members.get(fm, ()) if pos not in is_frame) for fm in self.names}
+            counts = {}
+            # Children are listed after their parents in `branch` order, so sum bottom-up
+            for root in self.roots:
+                for fm in reversed(self.branch(root)):
+                    counts[fm] = own[fm] + sum(counts[child] for child in self.children.get(fm, ()))
+            self._member_counts = counts
+        return self._member_counts
+
+    def list_filter(self, tree, bitflag, names=None, key=None):
+        """UIList filter flags / new order over `tree.nodes`, built once per index.
+
+        `names` restricts the shown frames (in that order), `key` identifies it in the cache.
+        """
+        cache_key = (bitflag, key if names is not None else None)
+        cached = self._list_filter.get(cache_key)
+        if cached is not None:
+            return cached
+        if names is None:
+            names = self.sorted_names
+        count = len(tree.nodes)
+        flt_flags = [0] * count
+        flt_neworder = [-1] * count
+        for rank, name in enumerate(names):
+            pos = self.position_of[name]
+            flt_flags[pos] = bitflag
+            flt_neworder[pos] = rank
+        tail = len(names)
+        for pos in range(count):
+            if flt_neworder[pos] < 0:
+                flt_neworder[pos] = tail
+                tail += 1
+
+        if len(self._list_filter) > 32:
+            self._list_filter.clear()
+        self._list_filter[cache_key] = (flt_flags, flt_neworder)
+        return flt_flags, flt_neworder
+
+
+def new_frame_id():
+    return uuid.uuid4().hex[:12]
+
+
+def read_frame_ids(frames):
+    """Stable ID of every frame node of `frames`, in order, None for frames without one.
+
+    Duplicated frames copy the custom property, a repeated ID belongs to the first frame.
+    """
+    ids = []
+    seen = set()
+    for fm in frames:
+        frame_id = fm.get(ID_KEY)
+        if not frame_id or frame_id in seen:
+            frame_id = None
+        else:
+            seen.add(frame_id)
+        ids.append(frame_id)
+    return ids
+
+
+# [ Cache ]
+# Indexes are keyed by the tree pointer. A tree's index is rebuilt when its
+# generation is bumped (an add-on operator wrote to it) or when nodes are
+# added/removed. Selection clicks in the editor do not always reach the
+# depsgraph, so the select flags are compared in C via foreach_get on every
+# lookup, a change only updates the selection columns in place (names, hierarchy
+# and member counts are kept).
+# Other edits only mark the tree dirty: the next lookup compares the frame
+# columns (one pass over the frames, not the nodes) and rebuilds if they differ.
+_indices = {}
+_generation = {}
+_dirty = set()
+
+
+def _locations(tree):
+    Nodes = tree.nodes
+    loc = np.empty(len(Nodes) * 2, dtype=np.float32)
+    Nodes.foreach_get('location', loc)
+    return loc.tobytes()
+
+
+def _selection(tree):
+    Nodes = tree.nodes
+    sel = np.empty(len(Nodes), dtype=bool)
+    Nodes.foreach_get('select', sel)
+    return sel
+
+
+def frame_index(tree, order_mode='NAME'):
+    if tree is None:
+        return None
+    key = tree.as_pointer()
+    index = _indices.get(key)
+    if index is not None and key in _dirty:
+        _dirty.discard(key)
+        if frames_changed(tree, index):
+            index = None
+        else:
+            index.members_stale = True
+    stamp = (_generation.get(key, 0), len(tree.nodes), order_mode)
+    selection = _selection(tree)
+    if index is None or index.stamp != stamp:
+        index = _indices[key] = FrameIndex(tree, stamp, selection, order_mode)
+    elif index.selection != selection.tobytes():
+        index.set_selection(selection)
+    return index
+
+
+def cached_index(tree, order_mode=None):
+    """Index of `tree` without the selection check (no foreach_get), for callers
+    reading names and labels only, in any order mode unless `order_mode` is given.
+    Falls back to frame_index when it may be stale"""
+    key = tree.as_pointer()
+    index = _indices.get(key)
+    if (index is None or key in _dirty or order_mode not in (None, index.order_mode)
+            or index.stamp[0] != _generation.get(key, 0) or index.stamp[1] != len(tree.nodes)):
+        return frame_index(tree, order_mode or (index.order_mode if index else 'NAME'))
+    return index
+
+
+def order_mode(context):
+    Props = getattr(context.scene, 'frame_focus', None)
+    return Props.order_mode if Props else 'NAME'
+
+
+def context_index(context):
+    tree = getattr(context.space_data, 'edit_tree', None)
+    return frame_index(tree, order_mode(context))
+
+
+def invalidate(tree):
+    if tree is None:
+        return
+    key = tree.as_pointer()
+    _generation[key] = _generation.get(key, 0) + 1
+
+
+def mark_dirty(tree):
+    _dirty.add(tree.as_pointer())
+
+
+def frames_changed(tree, index):
+    """Whether nodes were added/removed or a frame's name, label, text, flags,
+    parent or sort key differ from what `index` holds"""
+    if len(tree.nodes) != index.stamp[1]:
+        return True
+    frames = index.frames
+    try:
+        if [fm.name for fm in frames] != index.names:
+            return True
+        if [fm.label for fm in frames] != index.labels:
+            return True
+        if [fm.shrink for fm in frames] != index.shrink:
+            return True
+        if [fm.use_custom_color for fm in frames] != index.use_custom_color:
+            return True
+        if [fm.text.name if fm.text else '' for fm in frames] != index.texts:
+            return True
+        if [fm.parent for fm in index.sorted] != index.parents:
+            return True
+        return index.keys is not None and [fm.get(ORDER_KEY) for fm in frames] != index.keys
+    except ReferenceError:
+        return True
+
+
+def clear():
+    _indices.clear()
+    _generation.clear()
+    _dirty.clear()
+
+
+# [ Change Tracking ]
+# UI edits of these properties are published on the message bus. Python writes
+# and operators are not: they reach the depsgraph handler below, and the add-on
+# operators invalidate their tree themselves.
+WATCHED = (
+    ('Node', 'name'),
+    ('Node', 'label'),
+    ('Node', 'color'),
+    ('Node', 'select'),
+    ('Node', 'use_custom_color'),
+    ('Node', 'parent'),
+    ('NodeFrame', 'shrink'),
+    ('NodeFrame', 'label_size'),
+    ('NodeFrame', 'text'),
+)
+_msgbus_owner = object()
+
+
+def _on_watched_change(*args):
+    # The notification does not tell which node changed: the trees open in a node
+    # editor are the ones the sidebar and the editor itself edit
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'NODE_EDITOR':
+                tree = getattr(area.spaces.active, 'edit_tree', None)
+                if tree is not None:
+                    mark_dirty(tree)
+
+
+def subscribe():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for struct, prop in WATCHED:
+        bpy.msgbus.subscribe_rna(key=(getattr(bpy.types, struct), prop), owner=_msgbus_owner,
+                                 args=(), notify=_on_watched_change)
+
+
+# [ Handlers ]
+def _owned_tree(ID):
+    if isinstance(ID, bpy.types.NodeTree):
+        return ID
+    return getattr(ID, 'node_tree', None)
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    # Runs on every tick of a node drag: only the dirty flag is set here, the
+    # check happens on the next lookup
+    for update in depsgraph.updates:
+        tree = _owned_tree(update.id.original)
+        if tree is not None:
+            mark_dirty(tree)
+
+
+@persistent
+def _on_reload(*args):
+    # Undo and file loads rebuild all datablocks, so cached node references are stale
+    clear()
+
+
+@persistent
+def _on_load(*args):
+    # Loading a file drops all message bus subscriptions
+    clear()
+    subscribe()
+
+
+_handlers = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+    (bpy.app.handlers.load_post, _on_load),
+)
+
+
+def register():
+    for handlers, func in _handlers:
+        if func not in handlers:
+            handlers.append(func)
+    subscribe()
+
+
+def unregister():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for handlers, func in _handlers:
+        if func in handlers:
+            handlers.remove(func)
+    clear()
@@ -0,0 +1,238 @@
+"""Batch edit the frames of many .blend files from the command line.
+
+    blender -b --python frame_cli.py -- assets/ --default-color --reorder 0 -j 4
+
+Every file is opened by its own background Blender (at most --jobs at a time),
+edited with the context-free functions of frame_core, saved when anything
+changed, and described by a JSON report written next to it (or in --report-dir).
+The coordinating process does not need bpy: `python frame_cli.py --blender PATH ...`
+works as well.
+"""
+import argparse
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+SCRIPT = os.path.abspath(__file__)
+ADDON_DIR = os.path.dirname(SCRIPT)
+REPORT_SUFFIX = ".frames.json"
+SCOPES = ('MATERIALS', 'NODE_GROUPS', 'ALL')
+ORDER_TYPES = ('0', '1', '2', '3', '4', '5')
+
+
+# [ Arguments ]
+def cli_argv(argv):
+    """Arguments meant for this script: after `--` inside Blender, all of them otherwise"""
+    return argv[argv.index('--') + 1:] if '--' in argv else argv[1:]
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='blender -b --python frame_cli.py --',
+                                     description='Normalize frame colors and order across .blend files.')
+    parser.add_argument('paths', nargs='*', help='.blend files or folders (searched recursively)')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help='Blender processes at a time')
+    parser.add_argument('--blender', help='Blender executable, default: the running Blender')
+    parser.add_argument('--report-dir', help='folder for the JSON reports, default: next to each file')
+    parser.add_argument('--timeout', type=float, default=600.0, help='seconds per file')
+    parser.add_argument('--dry-run', action='store_true', help='report the changes without saving')
+
+    edits = parser.add_argument_group('edits (applied in this order)')
+    edits.add_argument('--scope', choices=SCOPES, default='ALL', help='node trees to edit')
+    edits.add_argument('--pattern', default='', help='only trees whose owner name matches (* and ? wildcards)')
+    edits.add_argument('--all-nodes', action='store_true', help='color every node, not only frames')
+    edits.add_argument('--order-mode', choices=('NAME', 'KEY'), default='NAME',
+                       help='store the order by renaming frames or in a sort key')
+    edits.add_argument('--default-color', action='store_true', help='reset colors to the default grey')
+    edits.add_argument('--color', type=float, nargs=3, metavar=('R', 'G', 'B'), help='set this color')
+    edits.add_argument('--custom-color', choices=('on', 'off'), help='turn custom colors on or off')
+    edits.add_argument('--reorder', choices=ORDER_TYPES,
+                       help='sort all frames: 0 label, 1 hue, 2 reverse, 3 lightness, 4 perceptual hue, 5 palette groups')
+    edits.add_argument('--invert', action='store_true', help='invert the --reorder sort')
+    edits.add_argument('--palette', help='palette JSON (or legacy preset) for --reorder 5')
+
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--report', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.reorder == '5' and not args.palette:
+        parser.error('--reorder 5 needs --palette')
+    return args
+
+
+def edit_argv(args):
+    """The edit options of `args` as command line arguments for a worker"""
+    argv = ['--scope', args.scope, '--pattern', args.pattern, '--order-mode', args.order_mode]
+    if args.all_nodes:
+        argv.append('--all-nodes')
+    if args.default_color:
+        argv.append('--default-color')
+    if args.color:
+        argv += ['--color', *map(repr, args.color)]
+    if args.custom_color:
+        argv += ['--custom-color', args.custom_color]
+    if args.reorder:
+        argv += ['--reorder', args.reorder]
+    if args.invert:
+        argv.append('--invert')
+    if args.palette:
+        argv += ['--palette', os.path.abspath(args.palette)]
+    if args.dry_run:
+        argv.append('--dry-run')
+    return argv
+
+
+# [ Worker ]
+# Runs inside the background Blender that opened one file
+def load_addon(name='frame_focus'):
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(ADDON_DIR, '__init__.py'), submodule_search_locations=[ADDON_DIR])
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[name] = addon
+    spec.loader.exec_module(addon)
+    return addon
+
+
+def tree_edits(addon, args):
+    """(name, func(Tree) -> changed count) of the requested edits"""
+    core = addon.frame_core
+    frames_only = not args.all_nodes
+    mode = args.order_mode
+    edits = []
+    if args.default_color:
+        edits.append(('default_color', lambda Tree: core.set_default_colors(Tree, frames_only, False, mode)))
+    if args.color:
+        color = tuple(args.color)
+        edits.append(('color', lambda Tree: core.set_colors(Tree, color, frames_only, False, mode)))
+    if args.custom_color:
+        flag = args.custom_color == 'on'
+        edits.append(('custom_color', lambda Tree: core.set_custom_color(Tree, flag, frames_only, False, mode)))
+    if args.reorder:
+        palette = None
+        if args.palette:
+            palette = list(next(iter(addon.palette_library.read_pack(args.palette).values())))
+        edits.append(('reorder', lambda Tree: core.reorder_tree(Tree, args.reorder, args.invert, False, mode, palette)))
+    return edits
+
+
+def run_worker(args):
+    import bpy
+    started = time.perf_counter()
+    report = {'file':bpy.data.filepath, 'ok':False, 'saved':False, 'changed':0, 'trees':[]}
+    try:
+        addon = load_addon()
+        edits = tree_edits(addon, args)
+        for owner_name, Tree in addon.batch_engine.batch_trees(args.scope, args.pattern):
+            changed = {name: func(Tree) for name, func in edits}
+            frames = len(addon.frame_cache.frame_index(Tree, args.order_mode))
+            report['trees'].append({'owner':owner_name, 'tree':Tree.name, 'frames':frames, 'changed':changed})
+            report['changed'] += sum(changed.values())
+        if report['changed'] and not args.dry_run:
+            bpy.ops.wm.save_mainfile()
+            report['saved'] = True
+        report['ok'] = True
+    except Exception as error:
+        report['error'] = f"{type(error).__name__}: {error}"
+    report['seconds'] = round(time.perf_counter() - started, 3)
+    write_report(args.report, report)
+    return 0 if report['ok'] else 1
+
+
+# [ Coordinator ]
+def collect_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files += sorted(glob.glob(os.path.join(path, '**', '*.blend'), recursive=True))
+        else:
+            files.append(path)
+    # The same file twice would race on its save
+    return list(dict.fromkeys(os.path.abspath(path) for path in files))
+
+
+def report_path(filepath, report_dir=None):
+    """Report next to the file, or in `report_dir` with a hash of the file's folder:
+    files with the same name from different folders get their own report"""
+    name = os.path.basename(filepath)
+    if not report_dir:
+        return os.path.join(os.path.dirname(filepath), name + REPORT_SUFFIX)
+    folder = hashlib.sha1(os.path.dirname(os.path.abspath(filepath)).encode('utf-8')).hexdigest()[:8]
+    return os.path.join(report_dir, f"{name}.{folder}{REPORT_SUFFIX}")
+
+
+def write_report(path, report):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=1)
+
+
+def blender_binary():
+    try:
+        import bpy
+    except ImportError:
+        return None
+    return bpy.app.binary_path or None
+
+
+def process_file(blender, filepath, args):
+    """Edit one file in its own Blender, returns its report"""
+    path = report_path(filepath, args.report_dir)
+    if os.path.exists(path):
+        os.remove(path)
+    command = [blender, '-b', '--factory-startup', filepath, '--python', SCRIPT, '--',
+               '--worker', '--report', path, *edit_argv(args)]
+    started = time.perf_counter()
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=args.timeout)
+        error = f"Blender exited with code {result.returncode}: {result.stderr[-2000:]}"
+    except subprocess.TimeoutExpired:
+        error = f"timed out after {args.timeout:g}s"
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    # Blender crashed or hung before the worker could write its report
+    report = {'file':filepath, 'ok':False, 'saved':False, 'changed':0, 'trees':[], 'error':error,
+              'seconds':round(time.perf_counter() - started, 3)}
+    write_report(path, report)
+    return report
+
+
+def run_files(args):
+    blender = args.blender or blender_binary()
+    if not blender:
+        print("frame_cli: no Blender executable, pass --blender", file=sys.stderr)
+        return 2
+    files = collect_files(args.paths)
+    if not files:
+        print("frame_cli: no .blend files", file=sys.stderr)
+        return 2
+    if args.report_dir:
+        os.makedirs(args.report_dir, exist_ok=True)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        futures = [pool.submit(process_file, blender, filepath, args) for filepath in files]
+        for done, future in enumerate(as_completed(futures), 1):
+            report = future.result()
+            if report['ok']:
+                state = 'saved' if report['saved'] else 'unchanged' if not report['changed'] else 'dry run'
+                print(f"[{done}/{len(files)}] {report['file']}: {report['changed']} change(s), {state}")
+            else:
+                failed += 1
+                print(f"[{done}/{len(files)}] {report['file']}: FAILED {report.get('error', '')}")
+    print(f"frame_cli: {len(files) - failed} file(s) done, {failed} failed")
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    args = parse_args(cli_argv(sys.argv) if argv is None else argv)
+    if args.worker:
+        return run_worker(args)
+    return run_files(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,131 @@
+from .frame_cache import ORDER_KEY, frame_index, invalidate
+from .frame_pending import discard
+from .walk_engine import walk
+from .node_bulk import read_colors, scope_mask, target_mask, write_colors, write_flags
+from .sort_keys import (hue_keys, key_order, label_order, lab_hue_keys, lightness_keys, merge_in_place,
+                        palette_keys, stable_order)
+from .color_math import rgb_to_lab
+
+
+# [ Order ]
+ORDER_ITEMS = [
+    ('0','Label',''),
+    ('1','Color(Hue)',''),
+    ('2','Reverse',''),
+    ('3','Lightness','Dark to light, as the eye sees it (CIELAB)'),
+    ('4','Hue (Perceptual)','CIELAB hue angle, greys last'),
+    ('5','Palette Groups','Group frames by their closest palette color, dark to light in a group'),
+]
+
+def apply_order(Tree, index, Frames):
+    """Store the new order of frame names, by sort key or by renaming"""
+    if index.order_mode == 'KEY':
+        # Only frames whose position changed are written
+        for i,fm in enumerate(Frames):
+            Node = index.by_name[fm]
+            if Node.get(ORDER_KEY) != i:
+                Node[ORDER_KEY] = i
+    else:
+        Nodes = Tree.nodes
+        Length = len(str(len(Frames)))
+        newList = []
+        for i,fm in enumerate(Frames):
+            newName = '_fm_'+str(i).rjust(Length,'0')
+            index.by_name[fm].name = newName
+            newList.append(newName)
+        for fm in newList:
+            Nodes[fm].name =fm[1:]
+    discard(Tree)
+    invalidate(Tree)
+
+def reordered(Tree, index, Frames, useType, is_invert=False, sel_fms=None, palette=None):
+    """`Frames` with the frames of `sel_fms` (default: the selection) sorted in their own slots.
+
+    useType: one of ORDER_ITEMS. `palette` holds the RGB rows used by '5'.
+    """
+    Nodes = Tree.nodes
+    if sel_fms is None:
+        sel_fms = index.selected_names
+    sel_fms = list(sel_fms)
+    selected = list(sel_fms)
+
+    if useType=='0':
+        labels = [index.by_name[fm].label for fm in sel_fms]
+        order = label_order(labels,reverse=is_invert)
+        sel_fms = [sel_fms[i] for i in order]
+    if useType=='1':
+        colors = read_colors(Nodes)[[index.position_of[fm] for fm in sel_fms]]
+        order = stable_order(hue_keys(colors),reverse=not is_invert)
+        sel_fms = [sel_fms[i] for i in order]
+    if useType in {'3','4','5'}:
+        lab = rgb_to_lab(read_colors(Nodes)[[index.position_of[fm] for fm in sel_fms]])
+        if useType=='3':
+            columns = lightness_keys(lab)
+        elif useType=='4':
+            columns = lab_hue_keys(lab)
+        else:
+            columns = palette_keys(lab, rgb_to_lab(palette))
+        order = key_order(columns,reverse=is_invert)
+        sel_fms = [sel_fms[i] for i in order]
+
+    if useType=='2':
+        # Reverse the selection as the list shows it
+        members = set(sel_fms)
+        sel_fms = [fm for fm in Frames if fm in members][::-1]
+
+    return merge_in_place(Frames, selected, sel_fms)
+
+
+# [ Tree Edits ]
+# A node tree in, the number of changed nodes (or moved frames) out. Nothing here
+# reads the context, so the operators, the batch engine and the command line
+# (frame_cli.py) run the same code.
+DEFAULT_COLOR = (0.327964, 0.327964, 0.327964)
+
+def node_scope(Tree, index, frames_only=True, selected_only=True):
+    """Mask over `Tree.nodes`: frames or all nodes, only the selected ones or every one"""
+    make_mask = target_mask if selected_only else scope_mask
+    return make_mask(Tree.nodes, index, frames_only)
+
+
+def set_colors(Tree, color, frames_only=True, selected_only=True, order_mode='NAME'):
+    index = frame_index(Tree, order_mode)
+    return write_colors(Tree, node_scope(Tree, index, frames_only, selected_only), color)
+
+
+def set_default_colors(Tree, frames_only=True, selected_only=True, order_mode='NAME'):
+    return set_colors(Tree, DEFAULT_COLOR, frames_only, selected_only, order_mode)
+
+
+def set_custom_color(Tree, flag, frames_only=True, selected_only=True, order_mode='NAME'):
+    index = frame_index(Tree, order_mode)
+    return write_flags(Tree, node_scope(Tree, index, frames_only, selected_only), 'use_custom_color', flag)
+
+
+def commit_order(Tree, index, Frames):
+    """Apply `Frames` when it differs from the stored order, returns how many frames moved"""
+    moved = sum(1 for old, new in zip(index.sorted_names, Frames) if old != new)
+    if moved:
+        apply_order(Tree, index, Frames)
+    return moved
+
+
+# `order` is the order to start from (default: the stored one) and
+# `commit(Tree, index, Frames)` stores the result (default: commit_order, right
+# away). The operators pass the pending order and their deferred store.
+def reorder_tree(Tree, useType='0', is_invert=False, selected_only=False, order_mode='NAME', palette=None,
+                 order=None, commit=commit_order):
+    """Sort the frames (or the selected ones, in their own slots) of `Tree`"""
+    index = frame_index(Tree, order_mode)
+    if order is None:
+        order = index.sorted_names
+    sel_fms = index.selected_names if selected_only else order
+    return commit(Tree, index, reordered(Tree, index, order, useType, is_invert, sel_fms, palette))
+
+
+def walk_tree(Tree, walk_type='WALK_UP', steps=1, order_mode='NAME', order=None, commit=commit_order):
+    """Walk the selected frames of `Tree`, see walk_engine.walk"""
+    index = frame_index(Tree, order_mode)
+    if order is None:
+        order = index.sorted_names
+    return commit(Tree, index, walk(order, index.selected_names, walk_type, steps))
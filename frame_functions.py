@@ -1,6 +1,19 @@
 import bpy
 import json
 import os
+from functools import partial
+from bpy.app.handlers import persistent
+from .frame_cache import context_index, invalidate
+from .frame_core import ORDER_ITEMS, apply_order, commit_order, reorder_tree, walk_tree
+from .frame_pending import current_order, defer, pending_order
+from .node_bulk import (finish_batch, position_mask, read_flags, target_mask, write_colors, write_flags,
+                        write_frame_flags)
+from .frame_view import focus_frames
+from .frame_handles import history, record_focus, resolve
+from .frame_search import search_frames
+from . import frame_search
+from .frame_spatial import visible_frames
+from .color_functions import palette_colors
 
 
 # [ Props ]
@@ -11,6 +24,23 @@ class FRAMEFOCUS_Props(bpy.types.PropertyGroup):
                                                 ('1','Look','Look','HIDE_OFF',1),
                                                 ('2','Word','Word','OUTLINER_OB_FONT',2)],
                                         name='panel mode',default = 0)
+    order_mode : bpy.props.EnumProperty(items =[('NAME','Name','Order frames by their names, walking and sorting rename them','SORTALPHA',0),
+                                                ('KEY','Sort Key','Order frames by a stored sort key, names are left untouched','LINENUMBERS_ON',1)],
+                                        name='order mode',default = 'NAME')
+    use_deferred_order : bpy.props.BoolProperty(name='Deferred Order', default=False,
+                                                description='Collect walk and sort clicks and write the new order once they stop, as one undo step')
+    use_list_view : bpy.props.BoolProperty(name='List View', default=False,
+                                           description='Show frames in a scrolling list that only draws visible rows')
+    frame_list_index : bpy.props.IntProperty(name='Active Frame', default=0)
+    frame_list_rows : bpy.props.IntProperty(name='List Rows', default=10, min=3, max=50)
+    visible_only : bpy.props.BoolProperty(name='Visible Only', default=False,
+                                          description='Only list frames inside the node editor view')
+    use_hierarchy : bpy.props.BoolProperty(name='Hierarchy', default=False,
+                                           description='Show nested frames as collapsible branches')
+    show_members : bpy.props.BoolProperty(name='Member Counts', default=True,
+                                          description='Show how many nodes each frame holds, nested frames included')
+    search : bpy.props.StringProperty(name='Search', default='', options={'TEXTEDIT_UPDATE'},
+                                      description='Filter frames by label and text, Ctrl Alt Enter focuses the best match')
 
 class FRAMEFOCUS_OT_SelectAll(bpy.types.Operator):
     """Select All Frames / Deselect"""
@@ -19,20 +49,18 @@ class FRAMEFOCUS_OT_SelectAll(bpy.types.Operator):
     def execute(self, context):
         snode = context.space_data
         Nodes = snode.edit_tree.nodes
-        Fms = [fm for fm in Nodes if fm.type == 'FRAME']
+        index = context_index(context)
+        Fms = index.frames
 
         # Check is no frame selected
-        isNoSel = True
-        for Fm in Fms:
-            if Fm.select:
-                isNoSel = False
-                break
+        isNoSel = not index.any_selected
         
         bpy.ops.node.select_all(action='DESELECT')
         for Fm in Fms:
             Fm.select = isNoSel
             Nodes.active = None if isNoSel else Fms[0]
 
+        invalidate(snode.edit_tree)
         return {'FINISHED'}
 
 
@@ -41,60 +69,78 @@ class FRAMEFOCUS_OT_Focus(bpy.types.Operator):
     bl_idname = "frame_focus.frame_focus"
     bl_label = "Frame Focus"
     frame : bpy.props.StringProperty(default="")
+    handle : bpy.props.StringProperty(default="", description='Stable frame ID, used instead of the name when set')
+    use_selected : bpy.props.BoolProperty(name='Selected Frames', default=False,
+                                          description='Focus the union of all selected frames')
+    record : bpy.props.BoolProperty(default=True, options={'HIDDEN', 'SKIP_SAVE'})
     def execute(self, context):
         snode = context.space_data
-        Nodes = snode.edit_tree.nodes
-        Sels = [nd for nd in Nodes if nd.select]
-
-        bpy.ops.node.select_all(action='DESELECT')
+        index = context_index(context)
+        if self.use_selected:
+            Frames = index.selected
+        elif self.handle:
+            Frame = resolve(snode.edit_tree, self.handle)
+            Frames = [Frame] if Frame is not None else []
+        else:
+            Frames = [index.by_name[self.frame]] if self.frame in index.by_name else []
+        if not Frames:
+            return {'CANCELLED'}
+
+        if not focus_frames(context, Frames):
+            focus_by_selection(snode.edit_tree, Frames)
+        if self.record and len(Frames) == 1:
+            record_focus(snode.edit_tree, Frames[0])
+        return {'FINISHED'}
+    
+def focus_by_selection(Tree, Frames):
+    # Fallback when the view can't be set directly: select, view, restore selection
+    Nodes = Tree.nodes
+    Sels = read_flags(Nodes, 'select')
+
+    bpy.ops.node.select_all(action='DESELECT')
+    for Frame in Frames:
+        Frame.select=1
+    bpy.ops.node.view_selected()
+
+    Nodes.foreach_set('select', Sels)
+    invalidate(Tree)
+
+def store_order(context, Tree, index, Frames):
+    """Apply the new order now, or keep it pending when the order is deferred"""
+    if context.scene.frame_focus.use_deferred_order:
+        defer(Tree, index, Frames, apply_order)
+    elif commit_order(Tree, index, Frames):
+        # The same undo step a deferred commit pushes, see frame_pending.flush
+        bpy.ops.ed.undo_push(message="Frame Order")
+
+class FRAMEFOCUS_OT_Search_Focus(bpy.types.Operator):
+    """Focus The Best Match Of The Frame Search"""
+    bl_idname = "frame_focus.search_focus"
+    bl_label = "Focus Best Match"
 
-        Nodes[self.frame].select=1
-        bpy.ops.node.view_selected()
-        Nodes[self.frame].select=0
+    @classmethod
+    def poll(cls, context):
+        return bool(context.scene.frame_focus.search) and getattr(context.space_data, 'edit_tree', None) is not None
 
-        for Node in Nodes[:]:
-            Node.select= Node in Sels
+    def execute(self, context):
+        hits = search_hits(context)
+        if not hits:
+            return {'CANCELLED'}
+        return bpy.ops.frame_focus.frame_focus(frame=hits[0])
 
-        return {'FINISHED'}
-    
 class FRAMEFOCUS_OT_Reorder(bpy.types.Operator):
-    """Reorder Frames By Label / Color( Hue ) / Reverse"""
+    """Reorder Frames By Label / Color / Reverse"""
     bl_idname = "frame_focus.reorder"
     bl_label = "Reorder Frames By Label / Color(Hue)"
-    useType : bpy.props.EnumProperty(items = [('0','Label',''),('1','Color(Hue)',''),('2','Reverse','')],default='0')
+    useType : bpy.props.EnumProperty(items = ORDER_ITEMS,default='0')
     is_invert :  bpy.props.BoolProperty(default=False)
     def execute(self, context):
         snode = context.space_data
-        Nodes = snode.edit_tree.nodes
-        Frames = sorted([fm.name for fm in Nodes if (fm.type=='FRAME')])
-        sel_fms = sorted([fm for fm in Frames  if Nodes[fm].select ])
-        unSel_fms= [fm for fm in Frames  if not Nodes[fm].select ]
-
-        if self.useType=='0':
-            sel_fms.sort(key=lambda x :Nodes[x].label,reverse=self.is_invert)
-        if self.useType=='1':
-            def color_value(Col):
-                H,S,V = Col.hsv
-                H,S,V = 1-H,1-S,1-V
-                HSV = int(H*255)*(10**6)+int(V*255)*(10**3)+int(S*255)
-                return HSV
-            sel_fms.sort(key=lambda x :color_value(Nodes[x].color),reverse=not self.is_invert)
-        
-        if self.useType=='2':
-            sel_fms.sort(reverse=True)
-
-        for i,fm in enumerate(Frames):
-            if fm in unSel_fms:
-                sel_fms.insert(i,fm)
-        # Rename
-        newList = []
-        Length = len(str(len(sel_fms)))
-        for i,Node in enumerate(sel_fms):
-            newName = '_fm_'+str(i).rjust(Length,'0')
-            Nodes[Node].name = newName
-            newList.append(newName)
-        for fm in newList:
-            Nodes[fm].name =fm[1:]
+        Tree = snode.edit_tree
+        index = context_index(context)
+        palette = palette_colors(context.scene.frame_color)
+        reorder_tree(Tree, self.useType, self.is_invert, True, index.order_mode, palette,
+                     order=current_order(Tree, index), commit=partial(store_order, context))
         return {'FINISHED'}
     
     def invoke(self, context, event):
@@ -116,105 +162,225 @@ class FRAMEFOCUS_OT_Walk(bpy.types.Operator):
     bl_idname = "frame_focus.frame_walk"
     bl_label = "Frames Order Walk"
     walk_type : bpy.props.StringProperty(default='WALK_UP')
+    steps : bpy.props.IntProperty(name='Steps', default=1, min=1)
     def execute(self, context):
-        snode = context.space_data
-        Nodes = snode.edit_tree.nodes
-
-        Frames = sorted([ fm.name for fm in Nodes[:] if fm.type=='FRAME'])
-        selected_frames = sorted([fm.name for fm in Nodes if (fm.type=='FRAME')and(fm.select) ])
-        
-
-        def id_walk(item,upDown):
-            fm_id = Frames.index(item)
-            walk_id = fm_id-1 if upDown else fm_id+1
-            Frames.remove(item)
-            Frames.insert(walk_id,item)
-
-        def WALK_UP():
-            Frames.insert(0,'frame_focus_TEMP_FOR_WALK_TOP')
-            Frames.append('frame_focus_TEMP_FOR_WALK_BTM')
-            for fm in selected_frames:
-                id_walk(fm,True)
-            Frames.remove('frame_focus_TEMP_FOR_WALK_TOP')
-            Frames.remove('frame_focus_TEMP_FOR_WALK_BTM')
-
-        def WALK_DOWN():
-            Frames.insert(0,'frame_focus_TEMP_FOR_WALK_TOP')
-            Frames.append('frame_focus_TEMP_FOR_WALK_BTM')
-            selected_frames.reverse()
-            for fm in selected_frames:
-                id_walk(fm,False)
-            Frames.remove('frame_focus_TEMP_FOR_WALK_TOP')
-            Frames.remove('frame_focus_TEMP_FOR_WALK_BTM')
-        
-        def TO_TOP():
-            for fm in selected_frames[::-1]:
-                Frames.remove(fm)
-                Frames.insert(0,fm)
-        
-        def TO_BOTTOM():
-            for fm in selected_frames:
-                Frames.remove(fm)
-                Frames.append(fm)
-        WALK_TYPE = {
-            'WALK_UP':WALK_UP,
-            'WALK_DOWN':WALK_DOWN,
-            'TO_TOP':TO_TOP,
-            'TO_BOTTOM':TO_BOTTOM
-            }
-        WALK_TYPE[self.walk_type]()
-
-        Length = len(str(len(Frames)))
-        newList = []
-        for i,Node in enumerate(Frames):
-            newName = '_fm_'+str(i).rjust(Length,'0')
-            Nodes[Node].name = newName
-            newList.append(newName)
-        for fm in newList:
-            Nodes[fm].name =fm[1:]
-
+        Tree = context.space_data.edit_tree
+        index = context_index(context)
+        walk_type, steps = self.walk_type, self.steps
+        if walk_type in {'PAGE_UP', 'PAGE_DOWN'}:
+            walk_type = 'WALK_UP' if walk_type == 'PAGE_UP' else 'WALK_DOWN'
+            steps = context.scene.frame_focus.frame_list_rows
+        walk_tree(Tree, walk_type, steps, index.order_mode,
+                  order=current_order(Tree, index), commit=partial(store_order, context))
         return {'FINISHED'}
 
 class FRAMEFOCUS_OT_Batch_UseCustomColor(bpy.types.Operator):
     """Batch Set Use Color Of Selected Frames"""
     bl_idname = "frame_focus.frame_batch_use_custom_color"
     bl_label = "Batch Custom Color"
+    bl_options = {'UNDO'}
     frame : bpy.props.StringProperty(default="")
     def execute(self, context):
         snode = context.space_data
-        #Tree = snode.edit_tree
-        Nodes = snode.edit_tree.nodes
+        Tree = snode.edit_tree
+        index = context_index(context)
         
-        Fms = [Node for Node in Nodes if (Node.select) and (Node.type=='FRAME')]
-        isAllTrue = False if False in [Fm.use_custom_color for Fm in Fms] else True
-        for Fm in Fms:
-            Fm.use_custom_color = not isAllTrue
+        isAllTrue = index.all_custom_color
+        mask = target_mask(Tree.nodes, index, True)
+        count = write_flags(Tree, mask, 'use_custom_color', not isAllTrue)
             
-        return {'FINISHED'}
+        return finish_batch(self, context, count)
 
 class FRAMEFOCUS_OT_Batch_Shrink(bpy.types.Operator):
     """Batch Set Shrink Of Selected Frames"""
     bl_idname = "frame_focus.frame_batch_shrink"
     bl_label = "Batch Set Shrink"
+    bl_options = {'UNDO'}
     frame : bpy.props.StringProperty(default="")
     def execute(self, context):
         snode = context.space_data
-        Nodes = snode.edit_tree.nodes
+        index = context_index(context)
         
-        Fms = [Node for Node in Nodes if (Node.select) and (Node.type=='FRAME')]
-        isAllTrue = False if False in [Fm.shrink for Fm in Fms] else True
-        for Fm in Fms:
-            Fm.shrink = not isAllTrue
+        isAllTrue = index.all_shrink
+        count = write_frame_flags(snode.edit_tree, index.selected, 'shrink', not isAllTrue)
             
-        return {'FINISHED'}
+        return finish_batch(self, context, count)
     
+# [ Members ]
+MEMBER_ACTIONS = [
+    ('SELECT','Select Members','Select every node inside the frames','RESTRICT_SELECT_OFF',0),
+    ('MUTE','Mute Members','Mute the nodes inside the frames, unmute when all are muted','MUTE_IPO_ON',1),
+    ('HIDE','Hide Members','Collapse the nodes inside the frames, expand when all are collapsed','HIDE_ON',2),
+    ('COLOR','Color Members','Give the nodes inside the frames a custom color','COLOR',3),
+]
+
+class FRAMEFOCUS_OT_Members(bpy.types.Operator):
+    """Select / Mute / Hide / Color Every Node Inside The Selected Frames"""
+    bl_idname = "frame_focus.members"
+    bl_label = "Frame Members"
+    bl_options = {'UNDO'}
+    action : bpy.props.EnumProperty(items=MEMBER_ACTIONS, default='SELECT')
+    frame : bpy.props.StringProperty(default="", description='Use this frame instead of the selected ones')
+    color : bpy.props.FloatVectorProperty(min=0.0, max=1.0, subtype='COLOR_GAMMA', default=(0.4, 0.08, 0.08))
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        Nodes = Tree.nodes
+        index = context_index(context)
+        names = [self.frame] if self.frame in index.by_name else index.selected_names
+        mask = position_mask(Nodes, index.member_positions(Tree, names))
+
+        if self.action == 'SELECT':
+            count = write_flags(Tree, mask, 'select', True)
+        elif self.action == 'COLOR':
+            # Nested frames keep their own color
+            mask[index.positions] = False
+            count = max(write_colors(Tree, mask, self.color), write_flags(Tree, mask, 'use_custom_color', True))
+        else:
+            attr = self.action.lower()
+            flags = read_flags(Nodes, attr)
+            count = write_flags(Tree, mask, attr, not flags[mask].all())
+        return finish_batch(self, context, count)
+
+class FRAMEFOCUS_MT_Members(bpy.types.Menu):
+    bl_label = "Frame Members"
+    def draw(self, context):
+        Layout = self.layout
+        for key, text, _, icon, _ in MEMBER_ACTIONS[:3]:
+            Layout.operator("frame_focus.members",text=text,icon=icon).action = key
+        Layout.separator()
+        Props = context.scene.frame_color
+        for i in range(1,10):
+            op = Layout.operator("frame_focus.members",text=f'Color Members {i}',icon='COLOR')
+            op.action = 'COLOR'
+            op.color = getattr(Props,f'color_{i}')
+
 # [ Panel ]
 
+# [ Hierarchy ]
+# Open branches per tree pointer (UI state only, not saved in the file), as frame
+# node pointers: renames by the NAME order mode keep branches open
+_expanded = {}
+
+def expanded_branches(Tree):
+    return _expanded.setdefault(Tree.as_pointer(), set())
+
+def hierarchy_rows(context, index):
+    """(names, depth by name, key) of the visible hierarchy rows, cached per index, open branches and pending order"""
+    Tree = context.space_data.edit_tree
+    expanded = expanded_branches(Tree)
+    pending = pending_order(Tree, index)
+    if pending is None:
+        names, depths = index.hierarchy_rows(expanded)
+        version = None
+    else:
+        names, depths = index.hierarchy_rows(expanded, pending.order, pending.version)
+        version = pending.version
+    return names, depths, ('hierarchy', frozenset(expanded), version)
+
+def draw_branch_toggle(Layout, index, expanded, Node, depth):
+    if depth:
+        Layout.separator(factor=depth*1.5)
+    if Node.name in index.children:
+        is_open = Node.as_pointer() in expanded
+        icon = 'DISCLOSURE_TRI_DOWN' if is_open else 'DISCLOSURE_TRI_RIGHT'
+        Layout.operator("frame_focus.toggle_branch",text='',icon=icon,emboss=False).frame = Node.name
+    else:
+        Layout.label(text='',icon='BLANK1')
+
+def draw_branch_actions(Layout, index, Node):
+    if Node.name not in index.children:
+        return None
+    Layout.operator("frame_focus.select_branch",text='',icon='RESTRICT_SELECT_OFF').frame = Node.name
+    Layout.operator("frame_focus.branch_color",text='',icon='GROUP_VCOL').frame = Node.name
+
+class FRAMEFOCUS_OT_Toggle_Branch(bpy.types.Operator):
+    """Expand / Collapse Nested Frames"""
+    bl_idname = "frame_focus.toggle_branch"
+    bl_label = "Toggle Branch"
+    frame : bpy.props.StringProperty(default="")
+    def execute(self, context):
+        Frame = context_index(context).by_name.get(self.frame)
+        if Frame is None:
+            return {'CANCELLED'}
+        expanded = expanded_branches(context.space_data.edit_tree)
+        key = Frame.as_pointer()
+        if key in expanded:
+            expanded.discard(key)
+        else:
+            expanded.add(key)
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Select_Branch(bpy.types.Operator):
+    """Select A Frame And All Frames Nested In It"""
+    bl_idname = "frame_focus.select_branch"
+    bl_label = "Select Branch"
+    frame : bpy.props.StringProperty(default="")
+    extend : bpy.props.BoolProperty(default=False)
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        index = context_index(context)
+        if self.frame not in index.by_name:
+            return {'CANCELLED'}
+        if not self.extend:
+            bpy.ops.node.select_all(action='DESELECT')
+        for fm in index.branch(self.frame):
+            index.by_name[fm].select = True
+        Tree.nodes.active = index.by_name[self.frame]
+        invalidate(Tree)
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Branch_Color(bpy.types.Operator):
+    """Select A Branch And Open The Color Panel For It"""
+    bl_idname = "frame_focus.branch_color"
+    bl_label = "Branch Color"
+    frame : bpy.props.StringProperty(default="")
+    def execute(self, context):
+        if 'FINISHED' not in bpy.ops.frame_focus.select_branch(frame=self.frame):
+            return {'CANCELLED'}
+        context.scene.frame_color.frames_only = True
+        bpy.ops.frame_color.color_panel('INVOKE_DEFAULT')
+        return {'FINISHED'}
+
+def search_hits(context, index=None):
+    """Ranked frame names matching the search field, None when it is empty"""
+    query = context.scene.frame_focus.search
+    index = index or context_index(context)
+    if not query or index is None:
+        return None
+    Tree = context.space_data.edit_tree
+    pending = pending_order(Tree, index)
+    if pending is None:
+        return search_frames(Tree.as_pointer(), index, query)
+    return search_frames(Tree.as_pointer(), index, query, order=pending.order, order_key=pending.version)
+
+def shown_rows(context, index):
+    """(names, depths, key) of the frames the list shows.
+
+    depths is None outside the hierarchy view, key identifies the rows in the UIList cache.
+    """
+    fm_col = context.scene.frame_focus
+    hits = search_hits(context, index)
+    if hits is not None:
+        pending = pending_order(context.space_data.edit_tree, index)
+        names, depths, key = hits, None, ('search', fm_col.search, pending and pending.version)
+    elif fm_col.use_hierarchy:
+        names, depths, key = hierarchy_rows(context, index)
+    else:
+        pending = pending_order(context.space_data.edit_tree, index)
+        if pending is None:
+            names, depths, key = index.sorted_names, None, None
+        else:
+            names, depths, key = pending.order, None, ('pending', pending.version)
+    if fm_col.visible_only:
+        visible = visible_frames(context)
+        if visible is not None:
+            names = [fm for fm in names if fm in visible]
+            key = (key, 'visible', frozenset(visible))
+    return names, depths, key
+
 def frames_list(context):
     try :
-        Nodes = context.space_data.edit_tree.nodes
-        frames = [ fm for fm in Nodes if fm.type=='FRAME']
-        return frames
+        return list(context_index(context).frames)
     except:
         return None
 
@@ -240,28 +406,34 @@ class FRAMEFOCUS_PT_Main(bpy.types.Panel):
             row = layout.row()
             row.enabled = False
             row.label(text='No Any Node Tree Actived' , icon = 'ERROR')
+            layout.operator("frame_focus.blend_search",icon='VIEWZOOM')
             return None
-        frames = frames_list(context)
+        index = context_index(context)
         fm_col = context.scene.frame_focus
         box_main = layout.box()
         row = box_main.row()
-        draw_function_bar_L(row, frames)
+        draw_function_bar_L(row, index, history(Tree))
 
         pie_M = row.menu_pie()
         pie_M.alignment='CENTER'
         row_M = pie_M.row(align=True)
         row_M.prop(fm_col,'panel_mode',text='')
+        row_M.prop(fm_col,'order_mode',text='',icon_only=True)
+        row_M.prop(fm_col,'use_deferred_order',text='',icon='TIME')
+        row_M.prop(fm_col,'use_list_view',text='',icon='LONGDISPLAY')
+        row_M.prop(fm_col,'use_hierarchy',text='',icon='OUTLINER')
+        row_M.operator("frame_focus.blend_search",text='',icon='VIEWZOOM')
 
         pie_R = row.menu_pie()
         pie_R.alignment='RIGHT'
-        pie_R.enabled = len(frames)>0
+        pie_R.enabled = index.has_frame
         draw_function_bar_R(pie_R)
 
-def draw_function_bar_L(layout,frames):
-    hasFrame = len(frames)>0
-    isNoSelected = True in [fm.select for fm in frames]
-    isAllCustomColor= False not in [fm.use_custom_color for fm in frames if fm.select]
-    isAllShrink= False not in [fm.shrink for fm in frames if fm.select]
+def draw_function_bar_L(layout,index,visits=None):
+    hasFrame = index.has_frame
+    isNoSelected = index.any_selected
+    isAllCustomColor= index.all_custom_color
+    isAllShrink= index.all_shrink
 
     row = layout.row()
     pie_L = row.menu_pie()
@@ -289,6 +461,23 @@ def draw_function_bar_L(layout,frames):
     pie_L_4 = row_L.menu_pie()
     pie_L_4.operator('node.view_selected',icon='ZOOM_SELECTED',text='')
 
+    pie_L_5 = row_L.menu_pie()
+    pie_L_5.enabled = isNoSelected
+    pie_L_5.operator("frame_focus.frame_focus",text='',icon='SELECT_SET').use_selected = True
+
+    pie_L_6 = row_L.menu_pie()
+    pie_L_6.enabled = isNoSelected
+    pie_L_6.menu("FRAMEFOCUS_MT_Members",text='',icon='STICKY_UVS_LOC')
+
+    if visits is not None:
+        row_H = row_L.row(align=True)
+        pie_back = row_H.menu_pie()
+        pie_back.enabled = visits.can_back()
+        pie_back.operator("frame_focus.history",text='',icon='BACK').step = -1
+        pie_forward = row_H.menu_pie()
+        pie_forward.enabled = visits.can_forward()
+        pie_forward.operator("frame_focus.history",text='',icon='FORWARD').step = 1
+
 
 def draw_function_bar_R(Layout):
     row_R = Layout.row(align=True)
@@ -316,24 +505,40 @@ class FRAMEFOCUS_PT_Frame_Bar(bpy.types.Panel):
     bl_parent_id = "FRAMEFOCUS_PT_Main"
     @classmethod
     def poll(cls, context):
-        return frames_list(context)
+        index = context_index(context)
+        return index is not None and index.has_frame
     def draw(self, context):
         layout = self.layout
         col = layout.column(align=True)
-        PANEL_TYPE = {
-            '0':panelMode_none,
-            '1':panelMode_look,
-            '2':panelMode_word
-        }
-        panelMode_id = context.scene.frame_focus.get('panel_mode',0)
-        frames = frames_list(context)
-        if not frames:
+        fm_col = context.scene.frame_focus
+        panelMode_id = fm_col.get('panel_mode',0)
+        index = context_index(context)
+        if not index or not index.has_frame:
+            return None
+        row_search = col.row(align=True)
+        row_search.prop(fm_col,'search',text='',icon='VIEWZOOM')
+        row_search.operator("frame_focus.search_focus",text='',icon='ZOOM_SELECTED')
+        row_search.prop(fm_col,'visible_only',text='',icon='HIDE_OFF')
+        row_search.prop(fm_col,'show_members',text='',icon='NODE')
+        col.separator(factor=0.5)
+        if fm_col.use_list_view:
+            col.template_list("FRAMEFOCUS_UL_Frames", "", context.space_data.edit_tree, "nodes",
+                              fm_col, "frame_list_index", rows=fm_col.frame_list_rows)
             return None
-        frames.sort(key = lambda x : x.name)
-        for fm in frames:
+        names, depths, _ = shown_rows(context, index)
+        expanded = expanded_branches(context.space_data.edit_tree)
+        counts = index.member_counts(context.space_data.edit_tree) if fm_col.show_members else None
+        for name in names:
+            fm = index.by_name[name]
             box = col.box()
             boxRow = box.row(align=True)
+            if depths is not None:
+                draw_branch_toggle(boxRow, index, expanded, fm, depths.get(name, 0))
             PANEL_TYPE[str(panelMode_id)](boxRow,fm)
+            if counts is not None:
+                draw_member_count(boxRow, counts, name)
+            if depths is not None:
+                draw_branch_actions(boxRow, index, fm)
 
 def panelMode_none(Layout,Node):
     select_icon = 'RADIOBUT_ON' if Node.select else 'RADIOBUT_OFF'
@@ -360,26 +565,112 @@ def panelMode_word(Layout,Node):
     pie = Layout.menu_pie()
     pie.operator("frame_focus.frame_focus",text='',icon='ZOOM_SELECTED').frame=Node.name
 
+def draw_member_count(Layout, counts, name):
+    sub = Layout.row(align=True)
+    sub.alignment = 'RIGHT'
+    sub.enabled = False
+    sub.label(text=str(counts.get(name, 0)))
+
+PANEL_TYPE = {
+    '0':panelMode_none,
+    '1':panelMode_look,
+    '2':panelMode_word
+}
+
+# List View
+class FRAMEFOCUS_UL_Frames(bpy.types.UIList):
+    """Frame nodes of the edited tree, only visible rows are drawn"""
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        fm_col = context.scene.frame_focus
+        panelMode_id = fm_col.get('panel_mode',0)
+        row = layout.row(align=True)
+        frame_index = context_index(context)
+        hierarchy = fm_col.use_hierarchy and not fm_col.search
+        if hierarchy:
+            expanded = expanded_branches(context.space_data.edit_tree)
+            depths = hierarchy_rows(context, frame_index)[1]
+            draw_branch_toggle(row, frame_index, expanded, item, depths.get(item.name, 0))
+        PANEL_TYPE[str(panelMode_id)](row,item)
+        if fm_col.show_members:
+            draw_member_count(row, frame_index.member_counts(context.space_data.edit_tree), item.name)
+        if hierarchy:
+            draw_branch_actions(row, frame_index, item)
+
+    def draw_filter(self, context, layout):
+        pass
+
+    def filter_items(self, context, data, propname):
+        index = context_index(context)
+        if index is None:
+            return [], []
+        names, _, key = shown_rows(context, index)
+        if key is None:
+            return index.list_filter(data, self.bitflag_filter_item)
+        return index.list_filter(data, self.bitflag_filter_item, names, key)
+
 
 classes = (
     FRAMEFOCUS_OT_Focus,
     FRAMEFOCUS_OT_SelectAll,
     FRAMEFOCUS_OT_Walk,
+    FRAMEFOCUS_OT_Search_Focus,
+    FRAMEFOCUS_OT_Toggle_Branch,
+    FRAMEFOCUS_OT_Select_Branch,
+    FRAMEFOCUS_OT_Branch_Color,
     FRAMEFOCUS_OT_Reorder,
     FRAMEFOCUS_OT_Batch_UseCustomColor,
     FRAMEFOCUS_OT_Batch_Shrink,
+    FRAMEFOCUS_OT_Members,
+    FRAMEFOCUS_MT_Members,
+    FRAMEFOCUS_UL_Frames,
     FRAMEFOCUS_PT_Main,
     FRAMEFOCUS_PT_Frame_Bar,
 )
 
+addon_keymaps = []
+
+@persistent
+def _on_reload(*args):
+    # Undo / file load: the search indexes are keyed by tree pointers, which may be reused
+    frame_search.clear()
+
+
+_handlers = (
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+    (bpy.app.handlers.load_post, _on_reload),
+)
+
+
 def register():
     bpy.utils.register_class(FRAMEFOCUS_Props)
     bpy.types.Scene.frame_focus = bpy.props.PointerProperty(type= FRAMEFOCUS_Props)
     for cls in classes:
         bpy.utils.register_class(cls)
+    kc = bpy.context.window_manager.keyconfigs.addon
+    if kc:
+        km = kc.keymaps.new(name='Node Editor', space_type='NODE_EDITOR')
+        kmi = km.keymap_items.new(FRAMEFOCUS_OT_Search_Focus.bl_idname, 'RET', 'PRESS', ctrl=True, alt=True)
+        addon_keymaps.append((km, kmi))
+        # Walk the selection by one list page (List Rows)
+        for key in ('PAGE_UP', 'PAGE_DOWN'):
+            kmi = km.keymap_items.new(FRAMEFOCUS_OT_Walk.bl_idname, key, 'PRESS', ctrl=True, alt=True)
+            kmi.properties.walk_type = key
+            addon_keymaps.append((km, kmi))
+    for handlers, func in _handlers:
+        if func not in handlers:
+            handlers.append(func)
+
 def unregister():
+    for handlers, func in _handlers:
+        if func in handlers:
+            handlers.remove(func)
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
     for cls in classes:
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.frame_focus
     bpy.utils.unregister_class(FRAMEFOCUS_Props)
+    frame_search.clear()
 
@@ -0,0 +1,240 @@
+import bpy
+from bpy.app.handlers import persistent
+from .frame_cache import ID_KEY, cached_index, new_frame_id, read_frame_ids
+
+
+# [ Handles ]
+# A handle is the frame ID custom property, it survives renames. Frames without
+# one get a session handle ("@" + node pointer) instead: looking a frame up or
+# focusing it never writes to the file, only bookmarks assign IDs.
+# Handles resolve through a {handle: name} map per tree, rebuilt only when the
+# tree's frame index changes (so unknown handles do not trigger rebuilds).
+SESSION_PREFIX = "@"
+_maps = {}
+
+def _handle_map(tree):
+    index = cached_index(tree)
+    key = tree.as_pointer()
+    entry = _maps.get(key)
+    if entry is None or entry[0] is not index:
+        by_handle = {SESSION_PREFIX + str(fm.as_pointer()): fm.name for fm in index.frames}
+        by_handle.update((frame_id, name) for frame_id, name in zip(read_frame_ids(index.frames), index.names)
+                         if frame_id)
+        entry = _maps[key] = (index, by_handle)
+    return entry[1]
+
+
+def resolve(tree, handle):
+    """Frame node of `handle` in `tree`, None when it no longer exists"""
+    if not handle:
+        return None
+    return tree.nodes.get(_handle_map(tree).get(handle, ''))
+
+
+def handle_of(tree, node, assign=False):
+    """Handle of a frame node. With `assign`, a frame without its own ID gets one
+    (written to the file), otherwise a session handle is returned"""
+    by_handle = _handle_map(tree)
+    handle = node.get(ID_KEY)
+    # Duplicated frames copy the ID, it belongs to the frame it resolves to
+    if handle and by_handle.get(handle) == node.name:
+        return handle
+    if not assign:
+        return SESSION_PREFIX + str(node.as_pointer())
+    handle = node[ID_KEY] = new_frame_id()
+    by_handle[handle] = node.name
+    return handle
+
+
+# [ History ]
+HISTORY_SIZE = 64
+
+class FocusHistory:
+    """Ring buffer of focused handles with a cursor, like a browser history"""
+    def __init__(self, size=HISTORY_SIZE):
+        self.items = [None] * size
+        self.start = 0
+        self.count = 0
+        self.cursor = -1
+
+    def _slot(self, i):
+        return (self.start + i) % len(self.items)
+
+    def current(self):
+        return self.items[self._slot(self.cursor)] if self.cursor >= 0 else None
+
+    def push(self, handle):
+        if handle == self.current():
+            return
+        # A new visit drops the forward entries
+        self.count = self.cursor + 1
+        if self.count == len(self.items):
+            self.start = self._slot(1)
+            self.count -= 1
+        self.items[self._slot(self.count)] = handle
+        self.count += 1
+        self.cursor = self.count - 1
+
+    def can_back(self):
+        return self.cursor > 0
+
+    def can_forward(self):
+        return self.cursor < self.count - 1
+
+    def move(self, step):
+        """Move the cursor by `step` and return the handle there, None at the ends"""
+        cursor = self.cursor + step
+        if not 0 <= cursor < self.count:
+            return None
+        self.cursor = cursor
+        return self.items[self._slot(cursor)]
+
+
+_histories = {}
+
+def history(tree):
+    key = tree.as_pointer()
+    found = _histories.get(key)
+    if found is None:
+        found = _histories[key] = FocusHistory()
+    return found
+
+
+def record_focus(tree, node):
+    history(tree).push(handle_of(tree, node))
+
+
+# [ Bookmarks ]
+# Stored on the tree (ID property), so they are saved with the file
+BOOKMARK_KEY = "frame_focus_bookmarks"
+
+def set_bookmark(tree, slot, node):
+    marks = dict(tree.get(BOOKMARK_KEY, {}))
+    marks[str(slot)] = handle_of(tree, node, assign=True)
+    tree[BOOKMARK_KEY] = marks
+
+
+def bookmark(tree, slot):
+    marks = tree.get(BOOKMARK_KEY)
+    return resolve(tree, marks.get(str(slot))) if marks else None
+
+
+def clear():
+    _maps.clear()
+    _histories.clear()
+
+
+@persistent
+def _on_reload(*args):
+    # Undo / file load: session handles are node pointers, which may be reused by other frames
+    clear()
+
+
+_handlers = (
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+    (bpy.app.handlers.load_post, _on_reload),
+)
+
+
+# [ Operator ]
+class FRAMEFOCUS_OT_History(bpy.types.Operator):
+    """Focus The Previous / Next Frame Of The Focus History"""
+    bl_idname = "frame_focus.history"
+    bl_label = "Focus History"
+    step : bpy.props.IntProperty(default=-1)
+
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.space_data, 'edit_tree', None) is not None
+
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        visits = history(Tree)
+        step = -1 if self.step < 0 else 1
+        # Deleted frames are skipped over
+        while True:
+            handle = visits.move(step)
+            if handle is None:
+                return {'CANCELLED'}
+            Frame = resolve(Tree, handle)
+            if Frame is not None:
+                return bpy.ops.frame_focus.frame_focus(handle=handle, record=False)
+
+class FRAMEFOCUS_OT_Bookmark_Set(bpy.types.Operator):
+    """Bookmark The Active Frame"""
+    bl_idname = "frame_focus.bookmark_set"
+    bl_label = "Set Frame Bookmark"
+    bl_options = {'UNDO'}
+    slot : bpy.props.IntProperty(default=1, min=1, max=9)
+
+    @classmethod
+    def poll(cls, context):
+        Tree = getattr(context.space_data, 'edit_tree', None)
+        return Tree is not None and Tree.nodes.active is not None and Tree.nodes.active.type == 'FRAME'
+
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        set_bookmark(Tree, self.slot, Tree.nodes.active)
+        self.report({'INFO'}, f"Bookmark {self.slot}: {Tree.nodes.active.label or Tree.nodes.active.name}")
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Bookmark_Jump(bpy.types.Operator):
+    """Focus The Bookmarked Frame"""
+    bl_idname = "frame_focus.bookmark_jump"
+    bl_label = "Jump To Frame Bookmark"
+    slot : bpy.props.IntProperty(default=1, min=1, max=9)
+
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.space_data, 'edit_tree', None) is not None
+
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        Frame = bookmark(Tree, self.slot)
+        if Frame is None:
+            self.report({'WARNING'}, f"No frame bookmarked on {self.slot}")
+            return {'CANCELLED'}
+        return bpy.ops.frame_focus.frame_focus(handle=handle_of(Tree, Frame))
+
+
+classes = (
+    FRAMEFOCUS_OT_History,
+    FRAMEFOCUS_OT_Bookmark_Set,
+    FRAMEFOCUS_OT_Bookmark_Jump,
+)
+
+addon_keymaps = []
+NUMBER_KEYS = ('ONE','TWO','THREE','FOUR','FIVE','SIX','SEVEN','EIGHT','NINE')
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    kc = bpy.context.window_manager.keyconfigs.addon
+    if kc:
+        km = kc.keymaps.new(name='Node Editor', space_type='NODE_EDITOR')
+        for step, key in ((-1,'COMMA'),(1,'PERIOD')):
+            kmi = km.keymap_items.new(FRAMEFOCUS_OT_History.bl_idname, key, 'PRESS', ctrl=True, alt=True)
+            kmi.properties.step = step
+            addon_keymaps.append((km, kmi))
+        for slot, key in enumerate(NUMBER_KEYS, 1):
+            kmi = km.keymap_items.new(FRAMEFOCUS_OT_Bookmark_Jump.bl_idname, key, 'PRESS', ctrl=True, alt=True)
+            kmi.properties.slot = slot
+            addon_keymaps.append((km, kmi))
+            kmi = km.keymap_items.new(FRAMEFOCUS_OT_Bookmark_Set.bl_idname, key, 'PRESS', ctrl=True, alt=True, shift=True)
+            kmi.properties.slot = slot
+            addon_keymaps.append((km, kmi))
+    for handlers, func in _handlers:
+        if func not in handlers:
+            handlers.append(func)
+
+def unregister():
+    for handlers, func in _handlers:
+        if func in handlers:
+            handlers.remove(func)
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
+    clear()
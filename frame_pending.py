@@ -0,0 +1,115 @@
+import bpy
+from bpy.app.handlers import persistent
+from .frame_cache import frame_index
+from .frame_view import tag_node_editors
+
+
+# [ Pending Order ]
+# Deferred walk / reorder clicks edit an in-memory order per tree pointer. The
+# list shows it right away, a timer writes the net permutation once after the
+# clicks stop, as a single undo step.
+DELAY = 0.4
+_pending = {}
+
+class PendingOrder:
+    __slots__ = ('tree', 'order', 'order_mode', 'commit', 'version', 'checked')
+    def __init__(self, tree, order_mode, commit):
+        self.tree = tree
+        self.order = []
+        self.order_mode = order_mode
+        self.commit = commit
+        self.version = 0
+        self.checked = None
+
+
+def pending_order(tree, index):
+    """The uncommitted order of `tree`, None when there is none or its frames changed"""
+    entry = _pending.get(tree.as_pointer())
+    if entry is None:
+        return None
+    if entry.checked is not index:
+        # Frames added, removed or renamed since the clicks: the order is stale
+        if entry.order_mode != index.order_mode or set(entry.order) != set(index.names):
+            discard(tree)
+            return None
+        entry.checked = index
+    return entry
+
+
+def current_order(tree, index):
+    """Frame names in list order, pending clicks included"""
+    entry = pending_order(tree, index)
+    return index.sorted_names if entry is None else entry.order
+
+
+def defer(tree, index, order, commit):
+    """Keep `order` as the pending order of `tree`, `commit(tree, index, order)` writes it later"""
+    key = tree.as_pointer()
+    entry = _pending.get(key)
+    if entry is None or entry.order_mode != index.order_mode:
+        entry = _pending[key] = PendingOrder(tree, index.order_mode, commit)
+    entry.order = list(order)
+    entry.version += 1
+    entry.checked = index
+    # Every click restarts the delay, holding a button commits once at the end
+    if bpy.app.timers.is_registered(flush):
+        bpy.app.timers.unregister(flush)
+    bpy.app.timers.register(flush, first_interval=DELAY)
+
+
+def discard(tree):
+    _pending.pop(tree.as_pointer(), None)
+
+
+def flush():
+    """Write every pending order, one undo step for all of them"""
+    entries = list(_pending.values())
+    _pending.clear()
+    committed = False
+    for entry in entries:
+        try:
+            tree = entry.tree
+            index = frame_index(tree, entry.order_mode)
+        except ReferenceError:
+            continue
+        if set(entry.order) != set(index.names):
+            continue
+        entry.commit(tree, index, entry.order)
+        committed = True
+    if committed:
+        bpy.ops.ed.undo_push(message="Frame Order")
+        tag_node_editors()
+    return None
+
+
+def clear():
+    _pending.clear()
+    if bpy.app.timers.is_registered(flush):
+        bpy.app.timers.unregister(flush)
+
+
+# [ Handlers ]
+@persistent
+def _on_reload(*args):
+    # Undo / file load: tree references are no longer valid, the clicks are dropped
+    clear()
+
+
+_handlers = (
+    (bpy.app.handlers.undo_post, _on_reload),
+    (bpy.app.handlers.redo_post, _on_reload),
+    (bpy.app.handlers.load_post, _on_reload),
+)
+
+
+def register():
+    for handlers, func in _handlers:
+        if func not in handlers:
+            handlers.append(func)
+
+
+def unregister():
+    for handlers, func in _handlers:
+        if func in handlers:
+            handlers.remove(func)
+    clear()
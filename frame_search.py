@@ -0,0 +1,129 @@
+# Incremental fuzzy search over frame labels / texts.
+# Pure Python (no bpy): documents are keyed by frame name.
+
+from collections import defaultdict
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def is_subsequence(query, text):
+    it = iter(text)
+    return all(ch in it for ch in query)
+
+
+class TrigramIndex:
+    """Trigram postings of lower-cased documents, updated one document at a time"""
+    def __init__(self):
+        self.raw = {}
+        self.docs = {}
+        self.grams = {}
+        self.postings = defaultdict(set)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def update(self, key, text):
+        if self.raw.get(key) == text:
+            return False
+        self.remove(key)
+        doc = text.lower()
+        grams = trigrams(doc)
+        self.raw[key] = text
+        self.docs[key] = doc
+        self.grams[key] = grams
+        for gram in grams:
+            self.postings[gram].add(key)
+        return True
+
+    def remove(self, key):
+        if key not in self.docs:
+            return
+        for gram in self.grams.pop(key):
+            keys = self.postings[gram]
+            keys.discard(key)
+            if not keys:
+                del self.postings[gram]
+        del self.docs[key]
+        del self.raw[key]
+
+    def sync(self, items):
+        """Match the index to `items` (key, text), only changed documents are re-indexed"""
+        items = dict(items)
+        for key in self.docs.keys() - items.keys():
+            self.remove(key)
+        changed = 0
+        for key, text in items.items():
+            changed += self.update(key, text)
+        return changed
+
+    def search(self, query, limit=None, threshold=0.4, rank=None):
+        """Keys ranked by match quality: prefix, substring, then trigram overlap.
+
+        Equal matches keep the order of `rank` (key -> position) when given, shorter documents first otherwise.
+        """
+        query = query.strip().lower()
+        if not query:
+            return []
+        qgrams = trigrams(query)
+        if len(query) < 3:
+            # Too short for trigrams, scan the cached lower-cased documents
+            candidates = {key: 0 for key, doc in self.docs.items() if query in doc}
+        else:
+            candidates = defaultdict(int)
+            for gram in qgrams:
+                for key in self.postings.get(gram, ()):
+                    candidates[key] += 1
+
+        scored = []
+        for key, shared in candidates.items():
+            doc = self.docs[key]
+            pos = doc.find(query)
+            if pos == 0:
+                score = 3.0
+            elif pos > 0:
+                score = 2.0
+            else:
+                score = shared / len(qgrams)
+                if is_subsequence(query, doc):
+                    score += 0.5
+                if score < threshold:
+                    continue
+            tie = (len(doc), key) if rank is None else rank[key]
+            scored.append((-score, tie, key))
+        scored.sort()
+        keys = [key for _, _, key in scored]
+        return keys[:limit] if limit else keys
+
+
+# [ Per Tree ]
+# One TrigramIndex per tree, synced whenever the tree's frame index is rebuilt
+_indexes = {}
+
+
+def frame_documents(index):
+    return ((name, f"{label} {text}" if text else label)
+            for name, label, text in zip(index.names, index.labels, index.texts))
+
+
+def search_frames(tree_key, index, query, limit=None, order=None, order_key=None):
+    """Ranked frame names, equal matches in `order` when given, cached per query and `order_key`"""
+    entry = _indexes.get(tree_key)
+    if entry is None or entry[0] is not index:
+        trigram = entry[1] if entry else TrigramIndex()
+        trigram.sync(frame_documents(index))
+        entry = _indexes[tree_key] = (index, trigram, {})
+    results = entry[2]
+    key = (query, order_key)
+    if key not in results:
+        if len(results) > 64:
+            results.clear()
+        rank = None if order is None else {name: i for i, name in enumerate(order)}
+        results[key] = entry[1].search(query, limit, rank=rank)
+    return results[key]
+
+
+def clear():
+    _indexes.clear()
@@ -0,0 +1,254 @@
+import bpy
+import json
+from collections import defaultdict, deque
+from bpy_extras.io_utils import ExportHelper, ImportHelper
+from .frame_cache import ID_KEY, context_index, frame_index, order_mode, read_frame_ids
+from .frame_core import apply_order
+from .blend_index import owner_data, tree_owners, TREE_ICONS
+from .node_bulk import read_colors, read_flags, write_at, write_frame_values
+from .sort_keys import merge_in_place
+
+
+# [ Snapshot ]
+# Column-wise JSON of a tree's frames in list order:
+# {"format": ..., "version": 1, "tree": name, "frames": {"id": [...], "label": [...], ...}}
+SNAPSHOT_FORMAT = "frame_focus_snapshot"
+MATCH_ITEMS = [
+    ('AUTO','ID Then Label','Match by frame ID, frames without a match by label'),
+    ('ID','ID','Only match frames with the same frame ID'),
+    ('LABEL','Label','Match frames by label, repeated labels in list order'),
+]
+
+def take_snapshot(Tree, index):
+    """Labels, colors, flags, label sizes and order of the frames of `Tree`.
+
+    Only IDs the frames already have are saved (the export does not write to the
+    file), frames without one are matched by label on import.
+    """
+    ids = dict(zip(index.names, read_frame_ids(index.frames)))
+    positions = [index.position_of[fm] for fm in index.sorted_names]
+    Nodes = Tree.nodes
+    return {
+        'format':SNAPSHOT_FORMAT,
+        'version':1,
+        'tree':Tree.name,
+        'frames':{
+            'id':[ids[fm] for fm in index.sorted_names],
+            'label':[fm.label for fm in index.sorted],
+            'color':[[round(float(c), 4) for c in color] for color in read_colors(Nodes)[positions]],
+            'use_custom_color':read_flags(Nodes, 'use_custom_color')[positions].tolist(),
+            'shrink':[fm.shrink for fm in index.sorted],
+            'label_size':[fm.label_size for fm in index.sorted],
+        },
+    }
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+# Column -> check of one value, the label column is required
+COLUMN_TYPES = {
+    'id':lambda value: value is None or isinstance(value, str),
+    'label':lambda value: isinstance(value, str),
+    'color':lambda value: isinstance(value, list) and len(value) == 3 and all(map(_is_number, value)),
+    'use_custom_color':lambda value: isinstance(value, (bool, int)),
+    'shrink':lambda value: isinstance(value, (bool, int)),
+    'label_size':lambda value: isinstance(value, int) and not isinstance(value, bool),
+}
+
+def read_snapshot(filepath):
+    """Snapshot data of `filepath`, ValueError when it is not a well-formed snapshot"""
+    with open(filepath, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get('format') != SNAPSHOT_FORMAT:
+        raise ValueError("not a frame snapshot")
+    columns = data.get('frames')
+    if not isinstance(columns, dict) or not isinstance(columns.get('label'), list):
+        raise ValueError("snapshot has no frame labels")
+    count = len(columns['label'])
+    for key, check in COLUMN_TYPES.items():
+        values = columns.get(key)
+        if values is None:
+            continue
+        if not isinstance(values, list) or len(values) != count:
+            raise ValueError(f"snapshot column '{key}' is not a list of {count} values")
+        if not all(map(check, values)):
+            raise ValueError(f"snapshot column '{key}' has values of the wrong type")
+    return data
+
+
+def match_frames(columns, index, match_by='AUTO'):
+    """Frame name for every snapshot row (None when unmatched), each frame used once"""
+    by_id = {frame_id: name for frame_id, name in zip(read_frame_ids(index.frames), index.names) if frame_id}
+    by_label = defaultdict(deque)
+    for fm in index.sorted:
+        by_label[fm.label].append(fm.name)
+
+    used = set()
+    matches = []
+    for row_id, label in zip(columns.get('id') or [None] * len(columns['label']), columns['label']):
+        name = None
+        if match_by != 'LABEL' and row_id is not None:
+            name = by_id.get(row_id)
+            if name in used:
+                name = None
+        # No (free) frame with this ID: AUTO falls back to the label
+        if name is None and match_by != 'ID':
+            queue = by_label.get(label)
+            while queue and queue[0] in used:
+                queue.popleft()
+            name = queue.popleft() if queue else None
+        if name is not None:
+            used.add(name)
+        matches.append(name)
+    return matches
+
+
+def apply_snapshot(Tree, index, data, match_by='AUTO'):
+    """Write a snapshot onto the matching frames of `Tree`.
+
+    Returns (matched frames, property writes, whether the order changed).
+    """
+    columns = data['frames']
+    matches = match_frames(columns, index, match_by)
+    rows = [i for i, name in enumerate(matches) if name is not None]
+    if not rows:
+        return 0, 0, False
+    names = [matches[i] for i in rows]
+    frames = [index.by_name[name] for name in names]
+    positions = [index.position_of[name] for name in names]
+
+    def column(key):
+        values = columns.get(key)
+        return None if values is None else [values[i] for i in rows]
+
+    changed = 0
+    # Colors and custom color flags: one foreach_set each over the whole tree
+    if column('color') is not None:
+        changed += write_at(Tree, positions, 'color', [list(map(float, c)) for c in column('color')])
+    if column('use_custom_color') is not None:
+        changed += write_at(Tree, positions, 'use_custom_color', [bool(v) for v in column('use_custom_color')])
+    # Frame-only properties: only the frames that differ are written
+    for key in ('label', 'shrink', 'label_size'):
+        values = column(key)
+        if values is not None:
+            changed += write_frame_values(Tree, frames, key, values)
+    # Frames matched by label take the snapshot ID (unless another frame holds it),
+    # the next import matches them by ID
+    if columns.get('id'):
+        owner_of = {frame_id: name for name, frame_id in zip(index.names, read_frame_ids(index.frames)) if frame_id}
+        for fm, row in zip(frames, rows):
+            frame_id = columns['id'][row]
+            if frame_id and fm.get(ID_KEY) != frame_id and owner_of.get(frame_id) is None:
+                fm[ID_KEY] = frame_id
+                owner_of[frame_id] = fm.name
+
+    # Order: the matched frames take their slots in snapshot order, one pass
+    order = merge_in_place(index.sorted_names, names, names)
+    reordered = order != index.sorted_names
+    if reordered:
+        apply_order(Tree, index, order)
+    return len(rows), changed, reordered
+
+
+# [ Operator ]
+_target_items = []
+
+def target_items(self, context):
+    _target_items.clear()
+    _target_items.append(('ACTIVE', 'Active Tree', 'The node tree of the editor', 'NODETREE', 0))
+    for kind, owner, tree in tree_owners():
+        identifier = json.dumps([kind, owner.name])
+        _target_items.append((identifier, owner.name, tree.name, TREE_ICONS[kind], len(_target_items)))
+    return _target_items
+
+
+def resolve_target(context, target):
+    if target == 'ACTIVE':
+        return getattr(context.space_data, 'edit_tree', None)
+    kind, owner_name = json.loads(target)
+    owner = owner_data(kind).get(owner_name)
+    if owner is None:
+        return None
+    return owner if kind == 'NODE_GROUP' else owner.node_tree
+
+
+class FRAMEFOCUS_OT_Snapshot_Export(bpy.types.Operator, ExportHelper):
+    """Save Labels, Colors, Shrink, Label Sizes And Order Of The Frames To JSON"""
+    bl_idname = "frame_focus.snapshot_export"
+    bl_label = "Export Frame Snapshot"
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.space_data, 'edit_tree', None) is not None
+
+    def execute(self, context):
+        Tree = context.space_data.edit_tree
+        data = take_snapshot(Tree, context_index(context))
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        self.report({'INFO'}, f"{len(data['frames']['label'])} frame(s) saved")
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Snapshot_Import(bpy.types.Operator, ImportHelper):
+    """Apply A Frame Snapshot To The Matching Frames Of A Node Tree"""
+    bl_idname = "frame_focus.snapshot_import"
+    bl_label = "Import Frame Snapshot"
+    bl_options = {'REGISTER', 'UNDO'}
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    match_by : bpy.props.EnumProperty(name='Match By', items=MATCH_ITEMS, default='AUTO')
+    target : bpy.props.EnumProperty(name='Node Tree', items=target_items)
+
+    def execute(self, context):
+        Tree = resolve_target(context, self.target)
+        if Tree is None:
+            self.report({'WARNING'}, "No node tree to apply the snapshot to")
+            return {'CANCELLED'}
+        index = frame_index(Tree, order_mode(context))
+        try:
+            data = read_snapshot(self.filepath)
+            matched, changed, reordered = apply_snapshot(Tree, index, data, self.match_by)
+        except (OSError, ValueError, KeyError) as error:
+            self.report({'ERROR'}, f"Cannot apply {self.filepath}: {error}")
+            return {'CANCELLED'}
+        if context.area:
+            context.area.tag_redraw()
+        missing = len(data['frames']['label']) - matched
+        order = ', reordered' if reordered else ''
+        self.report({'INFO'}, f"{matched} frame(s) matched, {missing} missing, {changed} change(s){order}")
+        return {'FINISHED'}
+
+
+# [ Panel ]
+class FRAMEFOCUS_PT_Snapshot(bpy.types.Panel):
+    bl_idname = "FRAMEFOCUS_PT_Snapshot"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Frames"
+    bl_label = 'Snapshot'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_parent_id = "FRAMEFOCUS_PT_Main"
+    bl_order = 90
+
+    def draw(self, context):
+        row = self.layout.row(align=True)
+        row.operator("frame_focus.snapshot_export",text='Export',icon='EXPORT')
+        row.operator("frame_focus.snapshot_import",text='Import',icon='IMPORT')
+
+
+classes = (
+    FRAMEFOCUS_OT_Snapshot_Export,
+    FRAMEFOCUS_OT_Snapshot_Import,
+    FRAMEFOCUS_PT_Snapshot,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,233 @@
+import bpy
+import math
+import numpy as np
+from .frame_cache import context_index
+from .frame_view import frame_rect, ui_scale, window_region
+from .node_bulk import read_vectors
+
+
+# [ Grid ]
+DIRECTIONS = {
+    'UP':(0.0, 1.0),
+    'DOWN':(0.0, -1.0),
+    'LEFT':(-1.0, 0.0),
+    'RIGHT':(1.0, 0.0),
+}
+
+class SpatialGrid:
+    """Uniform grid over frame rectangles (xmin, ymin, xmax, ymax)"""
+    def __init__(self, rects, keys):
+        self.rects = list(rects)
+        self.keys = list(keys)
+        self.centers = [((r[0] + r[2]) * 0.5, (r[1] + r[3]) * 0.5) for r in self.rects]
+        sizes = [max(r[2] - r[0], r[3] - r[1]) for r in self.rects]
+        self.cell = max(100.0, float(np.median(sizes))) if sizes else 100.0
+
+        self.cells = {}
+        self.center_cells = {}
+        for i, rect in enumerate(self.rects):
+            x0, y0 = self._cell(rect[0], rect[1])
+            x1, y1 = self._cell(rect[2], rect[3])
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self.cells.setdefault((cx, cy), []).append(i)
+            self.center_cells.setdefault(self._cell(*self.centers[i]), []).append(i)
+
+        if self.center_cells:
+            xs = [c[0] for c in self.center_cells]
+            ys = [c[1] for c in self.center_cells]
+            self.bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.bounds = (0, 0, 0, 0)
+
+    def __len__(self):
+        return len(self.rects)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell), math.floor(y / self.cell)
+
+    def at_point(self, x, y):
+        """Keys of the frames containing the point, innermost (smallest) first"""
+        hits = [i for i in self.cells.get(self._cell(x, y), ())
+                if self.rects[i][0] <= x <= self.rects[i][2] and self.rects[i][1] <= y <= self.rects[i][3]]
+        hits.sort(key=lambda i: (self.rects[i][2] - self.rects[i][0]) * (self.rects[i][3] - self.rects[i][1]))
+        return [self.keys[i] for i in hits]
+
+    def in_rect(self, rect):
+        """Keys of the frames overlapping `rect`"""
+        x0, y0 = self._cell(rect[0], rect[1])
+        x1, y1 = self._cell(rect[2], rect[3])
+        found = set()
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self.cells):
+            candidates = range(len(self.rects))
+        else:
+            candidates = (i for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)
+                          for i in self.cells.get((cx, cy), ()))
+        for i in candidates:
+            r = self.rects[i]
+            if r[0] <= rect[2] and r[2] >= rect[0] and r[1] <= rect[3] and r[3] >= rect[1]:
+                found.add(i)
+        return {self.keys[i] for i in found}
+
+    def nearest(self, x, y, direction, exclude=()):
+        """Key of the closest frame center lying in `direction` from the point.
+
+        Distance is measured along the direction, with sideways offset counting
+        double. Rings of cells are searched outward until no closer frame can exist.
+        """
+        if not self.rects:
+            return None
+        dx, dy = DIRECTIONS[direction]
+        ox, oy = self._cell(x, y)
+        bx0, by0, bx1, by1 = self.bounds
+        max_ring = max(abs(ox - bx0), abs(ox - bx1), abs(oy - by0), abs(oy - by1)) + 1
+        best, best_score = None, None
+        for ring in range(max_ring + 1):
+            # Every center in this ring is at least (ring - 1) cells away on one axis
+            if best_score is not None and (ring - 1) * self.cell > best_score:
+                break
+            for cell in self._ring(ox, oy, ring):
+                for i in self.center_cells.get(cell, ()):
+                    if self.keys[i] in exclude:
+                        continue
+                    cx, cy = self.centers[i]
+                    along = (cx - x) * dx + (cy - y) * dy
+                    if along <= 1.0:
+                        continue
+                    side = abs((cx - x) * dy - (cy - y) * dx)
+                    score = along + 2.0 * side
+                    if best_score is None or score < best_score:
+                        best, best_score = i, score
+        return None if best is None else self.keys[best]
+
+    @staticmethod
+    def _ring(ox, oy, ring):
+        if ring == 0:
+            yield (ox, oy)
+            return
+        for cx in range(ox - ring, ox + ring + 1):
+            yield (cx, oy - ring)
+            yield (cx, oy + ring)
+        for cy in range(oy - ring + 1, oy + ring):
+            yield (ox - ring, cy)
+            yield (ox + ring, cy)
+
+
+# [ Per Tree ]
+# Grids are rebuilt only when a frame's location or dimensions change
+_grids = {}
+
+def spatial_index(context):
+    tree = getattr(context.space_data, 'edit_tree', None)
+    index = context_index(context)
+    if index is None:
+        return None
+    Nodes = tree.nodes
+    locations = read_vectors(Nodes, 'location', 2)[index.positions]
+    dimensions = read_vectors(Nodes, 'dimensions', 2)[index.positions]
+    scale = ui_scale(context)
+
+    key = tree.as_pointer()
+    cached = _grids.get(key)
+    if (cached is not None and cached[0] == index.names and cached[1] == scale
+            and np.array_equal(cached[2], locations) and np.array_equal(cached[3], dimensions)):
+        return cached[4]
+    grid = SpatialGrid((frame_rect(fm, scale) for fm in index.frames), index.names)
+    _grids[key] = (list(index.names), scale, locations, dimensions, grid)
+    return grid
+
+
+def view_bounds(context):
+    region = window_region(context.area)
+    if region is None:
+        return None
+    view2d = region.view2d
+    x0, y0 = view2d.region_to_view(0, 0)
+    x1, y1 = view2d.region_to_view(region.width, region.height)
+    return (x0, y0, x1, y1)
+
+
+def visible_frames(context):
+    """Names of the frames overlapping the node editor view, None without a view"""
+    rect = view_bounds(context)
+    grid = spatial_index(context)
+    if rect is None or grid is None:
+        return None
+    return grid.in_rect(rect)
+
+
+def clear():
+    _grids.clear()
+
+
+# [ Operator ]
+class FRAMEFOCUS_OT_Jump_Direction(bpy.types.Operator):
+    """Focus The Nearest Frame In A Direction From The View Center"""
+    bl_idname = "frame_focus.jump_direction"
+    bl_label = "Jump To Frame"
+    direction : bpy.props.EnumProperty(items=[(key, key.title(), '') for key in DIRECTIONS], default='RIGHT')
+
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.space_data, 'edit_tree', None) is not None
+
+    def execute(self, context):
+        rect = view_bounds(context)
+        grid = spatial_index(context)
+        if rect is None or grid is None:
+            return {'CANCELLED'}
+        x, y = (rect[0] + rect[2]) * 0.5, (rect[1] + rect[3]) * 0.5
+        frame = grid.nearest(x, y, self.direction)
+        if frame is None:
+            return {'CANCELLED'}
+        return bpy.ops.frame_focus.frame_focus(frame=frame)
+
+class FRAMEFOCUS_OT_Focus_Under_Cursor(bpy.types.Operator):
+    """Focus The Frame Under The Mouse Cursor"""
+    bl_idname = "frame_focus.focus_under_cursor"
+    bl_label = "Focus Frame Under Cursor"
+
+    @classmethod
+    def poll(cls, context):
+        return getattr(context.space_data, 'edit_tree', None) is not None
+
+    def invoke(self, context, event):
+        region = window_region(context.area)
+        grid = spatial_index(context)
+        if region is None or grid is None:
+            return {'CANCELLED'}
+        x = event.mouse_x - region.x
+        y = event.mouse_y - region.y
+        hits = grid.at_point(*region.view2d.region_to_view(x, y))
+        if not hits:
+            return {'CANCELLED'}
+        return bpy.ops.frame_focus.frame_focus(frame=hits[0])
+
+
+classes = (
+    FRAMEFOCUS_OT_Jump_Direction,
+    FRAMEFOCUS_OT_Focus_Under_Cursor,
+)
+
+addon_keymaps = []
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+    kc = bpy.context.window_manager.keyconfigs.addon
+    if kc:
+        km = kc.keymaps.new(name='Node Editor', space_type='NODE_EDITOR')
+        for direction, key in (('UP','UP_ARROW'),('DOWN','DOWN_ARROW'),('LEFT','LEFT_ARROW'),('RIGHT','RIGHT_ARROW')):
+            kmi = km.keymap_items.new(FRAMEFOCUS_OT_Jump_Direction.bl_idname, key, 'PRESS', ctrl=True, alt=True)
+            kmi.properties.direction = direction
+            addon_keymaps.append((km, kmi))
+        kmi = km.keymap_items.new(FRAMEFOCUS_OT_Focus_Under_Cursor.bl_idname, 'F', 'PRESS', ctrl=True, alt=True)
+        addon_keymaps.append((km, kmi))
+
+def unregister():
+    for km, kmi in addon_keymaps:
+        km.keymap_items.remove(kmi)
+    addon_keymaps.clear()
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
+    clear()
@@ -0,0 +1,94 @@
+import bpy
+
+
+# [ Frame Bounds ]
+# Rectangles are in View2D coordinates: node locations scaled by the UI scale,
+# `dimensions` are already in that space.
+
+def ui_scale(context=None):
+    context = context or bpy.context
+    return context.preferences.system.ui_scale
+
+
+def absolute_location(Node):
+    loc = getattr(Node, 'location_absolute', None)
+    if loc is not None:
+        return loc.x, loc.y
+    x, y = Node.location
+    parent = Node.parent
+    while parent is not None:
+        x += parent.location.x
+        y += parent.location.y
+        parent = parent.parent
+    return x, y
+
+
+def frame_rect(Frame, scale):
+    """(xmin, ymin, xmax, ymax) of a frame, its location is the top-left corner"""
+    x, y = absolute_location(Frame)
+    x, y = x * scale, y * scale
+    w, h = Frame.dimensions
+    return (x, y - h, x + w, y)
+
+
+def union_rect(rects):
+    rects = list(rects)
+    if not rects:
+        return None
+    return (min(r[0] for r in rects), min(r[1] for r in rects),
+            max(r[2] for r in rects), max(r[3] for r in rects))
+
+
+def padded(rect, factor=0.1):
+    xmin, ymin, xmax, ymax = rect
+    dx = (xmax - xmin) * factor
+    dy = (ymax - ymin) * factor
+    return (xmin - dx, ymin - dy, xmax + dx, ymax + dy)
+
+
+# [ Region ]
+def window_region(area):
+    if area is None:
+        return None
+    for region in area.regions:
+        if region.type == 'WINDOW':
+            return region
+    return None
+
+
+def tag_node_editors():
+    """Redraw every node editor, for changes made outside an operator (timers)"""
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'NODE_EDITOR':
+                area.tag_redraw()
+
+
+def view_rect(context, rect):
+    """Frame `rect` in the node editor's main region, selection is left untouched.
+
+    Returns False when the view can't be set directly (no region, or the frames
+    were never drawn so their dimensions are still zero).
+    """
+    area = context.area
+    region = window_region(area)
+    xmin, ymin, xmax, ymax = rect
+    if region is None or xmax <= xmin or ymax <= ymin:
+        return False
+
+    view2d = region.view2d
+    x0, y0 = view2d.view_to_region(xmin, ymin, clip=False)
+    x1, y1 = view2d.view_to_region(xmax, ymax, clip=False)
+    with context.temp_override(area=area, region=region):
+        bpy.ops.view2d.zoom_border(xmin=int(x0), xmax=int(x1), ymin=int(y0), ymax=int(y1),
+                                   wait_for_input=False, zoom_out=False)
+    return True
+
+
+def focus_frames(context, frames):
+    """Frame the union of `frames` in the view"""
+    scale = ui_scale(context)
+    rect = union_rect(frame_rect(fm, scale) for fm in frames)
+    if rect is None:
+        return False
+    return view_rect(context, padded(rect))
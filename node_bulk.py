@@ -0,0 +1,144 @@
+import numpy as np
+from .frame_cache import invalidate
+
+
+# [ Bulk Read ]
+# Node attributes are read for the whole `tree.nodes` collection with a single
+# foreach_get, callers pick their rows with the positions from the frame index.
+
+def read_colors(Nodes):
+    buf = np.empty(len(Nodes) * 3, dtype=np.float32)
+    Nodes.foreach_get('color', buf)
+    return buf.reshape(-1, 3)
+
+
+def read_vectors(Nodes, attr, size):
+    buf = np.empty(len(Nodes) * size, dtype=np.float32)
+    Nodes.foreach_get(attr, buf)
+    return buf.reshape(-1, size)
+
+
+def read_flags(Nodes, attr):
+    buf = np.empty(len(Nodes), dtype=bool)
+    Nodes.foreach_get(attr, buf)
+    return buf
+
+
+def target_mask(Nodes, index, frames_only):
+    """Rows of `Nodes` a batch edit applies to: selected frames, or all selected nodes"""
+    if not frames_only:
+        return read_flags(Nodes, 'select')
+    mask = np.zeros(len(Nodes), dtype=bool)
+    mask[index.selected_positions] = True
+    return mask
+
+
+def scope_mask(Nodes, index, frames_only):
+    """Rows of every frame, or of every node, regardless of selection"""
+    if not frames_only:
+        return np.ones(len(Nodes), dtype=bool)
+    mask = np.zeros(len(Nodes), dtype=bool)
+    mask[index.positions] = True
+    return mask
+
+
+def position_mask(Nodes, positions):
+    mask = np.zeros(len(Nodes), dtype=bool)
+    mask[list(positions)] = True
+    return mask
+
+
+# [ Bulk Write ]
+# Writes go through foreach_set, which skips the per-property RNA update, so the
+# tree is tagged once afterwards. Each function returns the number of nodes changed.
+
+def write_colors(Tree, mask, color):
+    Nodes = Tree.nodes
+    colors = read_colors(Nodes)
+    color = np.asarray(color, dtype=np.float32)[:3]
+    changed = mask & (colors != color).any(axis=1)
+    count = int(changed.sum())
+    if count:
+        colors[changed] = color
+        Nodes.foreach_set('color', colors.ravel())
+        Tree.update_tag()
+    return count
+
+
+def write_color_rows(Tree, mask, rows):
+    """Write one color per masked node, `rows` follow the order of the masked nodes"""
+    Nodes = Tree.nodes
+    colors = read_colors(Nodes)
+    rows = np.asarray(rows, dtype=np.float32).reshape(-1, 3)
+    count = int((colors[mask] != rows).any(axis=1).sum())
+    if count:
+        colors[mask] = rows
+        Nodes.foreach_set('color', colors.ravel())
+        Tree.update_tag()
+    return count
+
+
+def write_at(Tree, positions, attr, values):
+    """Write one value per node position (colors, flags) with a single foreach_set"""
+    Nodes = Tree.nodes
+    values = np.asarray(values)
+    positions = np.asarray(positions, dtype=np.int64)
+    buf = np.empty((len(Nodes),) + values.shape[1:], dtype=values.dtype)
+    Nodes.foreach_get(attr, buf.reshape(-1))
+    changed = (buf[positions] != values).reshape(len(positions), -1).any(axis=1)
+    count = int(changed.sum())
+    if count:
+        buf[positions] = values
+        Nodes.foreach_set(attr, buf.reshape(-1))
+        Tree.update_tag()
+        invalidate(Tree)
+    return count
+
+
+def write_flags(Tree, mask, attr, value):
+    Nodes = Tree.nodes
+    flags = read_flags(Nodes, attr)
+    changed = mask & (flags != value)
+    count = int(changed.sum())
+    if count:
+        flags[changed] = value
+        Nodes.foreach_set(attr, flags)
+        Tree.update_tag()
+        invalidate(Tree)
+    return count
+
+
+def write_frame_flags(Tree, frames, attr, value):
+    # Frame-only properties (e.g. shrink) can't go through foreach_set on the mixed
+    # node collection, so only the frames that actually differ are written.
+    count = 0
+    for fm in frames:
+        if getattr(fm, attr) != value:
+            setattr(fm, attr, value)
+            count += 1
+    if count:
+        invalidate(Tree)
+    return count
+
+
+def write_frame_values(Tree, frames, attr, values):
+    """Per-frame version of `write_frame_flags` with one value per frame"""
+    count = 0
+    for fm, value in zip(frames, values):
+        if getattr(fm, attr) != value:
+            setattr(fm, attr, value)
+            count += 1
+    if count:
+        invalidate(Tree)
+    return count
+
+
+def finish_batch(op, context, count):
+    """Operator result of a bulk write: only an edit that changed nothing is reported
+    (and cancelled, so it leaves no empty undo step)"""
+    if not count:
+        op.report({'INFO'}, "Nothing to change")
+        return {'CANCELLED'}
+    if context.area:
+        context.area.tag_redraw()
+    return {'FINISHED'}
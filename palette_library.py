@@ -0,0 +1,161 @@
+import ast
+import bpy
+import json
+import os
+import re
+from functools import lru_cache
+
+
+# [ Library ]
+# One JSON file per palette: {"name": "...", "colors": [[r, g, b] x 9]}.
+# The directory listing is reused until the directory mtime changes, parsed
+# palettes are kept in an LRU cache keyed by (path, file mtime).
+PALETTE_SIZE = 9
+PACK_FORMAT = "frame_focus_palettes"
+EXTENSION = ".json"
+
+
+def library_dir(create=False):
+    # Only created when a palette is saved, listing a missing folder gives no palettes
+    return bpy.utils.extension_path_user(__package__, path="palettes", create=create)
+
+
+def clean_name(name):
+    return re.sub(r'[^\w\- .]', '_', name).strip(' .')
+
+
+def palette_path(name, directory=None):
+    return os.path.join(directory or library_dir(), clean_name(name) + EXTENSION)
+
+
+_listing = {'dir':None, 'mtime':None, 'names':()}
+
+def palette_names(directory=None):
+    """Sorted palette names, the directory is only rescanned when its mtime changes"""
+    directory = directory or library_dir()
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        return ()
+    if _listing['dir'] != directory or _listing['mtime'] != mtime:
+        names = (entry.name[:-len(EXTENSION)] for entry in os.scandir(directory)
+                 if entry.is_file() and entry.name.endswith(EXTENSION))
+        _listing.update(dir=directory, mtime=mtime, names=tuple(sorted(names, key=str.lower)))
+    return _listing['names']
+
+
+def validate(colors):
+    """Nine (r, g, b) tuples in 0..1, ValueError otherwise"""
+    if not isinstance(colors, (list, tuple)) or len(colors) != PALETTE_SIZE:
+        raise ValueError(f"a palette needs {PALETTE_SIZE} colors")
+    result = []
+    for color in colors:
+        if not isinstance(color, (list, tuple)) or len(color) != 3:
+            raise ValueError(f"not an RGB color: {color!r}")
+        try:
+            result.append(tuple(min(1.0, max(0.0, float(c))) for c in color))
+        except (TypeError, ValueError):
+            raise ValueError(f"not an RGB color: {color!r}") from None
+    return tuple(result)
+
+
+@lru_cache(maxsize=128)
+def _parse(path, mtime):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("not a palette file")
+    return validate(data.get('colors'))
+
+
+def load_palette(name, directory=None):
+    path = palette_path(name, directory)
+    return _parse(path, os.stat(path).st_mtime_ns)
+
+
+def save_palette(name, colors, directory=None):
+    path = palette_path(name, directory or library_dir(create=True))
+    data = {'name':clean_name(name), 'colors':[list(color) for color in validate(colors)]}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1)
+    # The directory mtime may not tick between two quick writes
+    _listing['mtime'] = None
+    return path
+
+
+def remove_palette(name, directory=None):
+    path = palette_path(name, directory)
+    if os.path.isfile(path):
+        os.remove(path)
+        _listing['mtime'] = None
+        return True
+    return False
+
+
+# [ Packs ]
+def export_pack(filepath, names=None, directory=None):
+    """Write the given (default: all) palettes into one JSON file, returns the count"""
+    names = palette_names(directory) if names is None else names
+    palettes = {name: [list(color) for color in load_palette(name, directory)] for name in names}
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump({'format':PACK_FORMAT, 'version':1, 'palettes':palettes}, f, indent=1)
+    return len(palettes)
+
+
+def read_legacy_preset(filepath):
+    """Colors of a Python preset saved by older versions, read without executing it.
+
+    Malformed presets raise ValueError.
+    """
+    with open(filepath, encoding='utf-8') as f:
+        source = f.read()
+    colors = {}
+    try:
+        tree = ast.parse(source, filepath)
+        for node in tree.body:
+            if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+                continue
+            target = node.targets[0]
+            if isinstance(target, ast.Attribute) and re.fullmatch(r'color_[1-9]', target.attr):
+                colors[int(target.attr[-1])] = ast.literal_eval(node.value)
+    except (SyntaxError, TypeError, MemoryError, RecursionError) as error:
+        raise ValueError(f"not a palette preset: {error}") from error
+    return validate([colors.get(i) for i in range(1, PALETTE_SIZE + 1)])
+
+
+def read_pack(filepath):
+    """{name: colors} of a palette pack, a single palette file is read as a pack of one.
+
+    Malformed files raise ValueError.
+    """
+    if filepath.endswith('.py'):
+        name = os.path.splitext(os.path.basename(filepath))[0]
+        return {clean_name(name): read_legacy_preset(filepath)}
+    with open(filepath, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("not a palette file")
+    if 'palettes' in data:
+        if not isinstance(data['palettes'], dict):
+            raise ValueError("'palettes' is not a name -> colors mapping")
+        return {clean_name(name): validate(colors) for name, colors in data['palettes'].items()}
+    name = data.get('name') or os.path.splitext(os.path.basename(filepath))[0]
+    return {clean_name(str(name)): validate(data.get('colors'))}
+
+
+def import_pack(filepath, overwrite=False, directory=None):
+    """Copy the palettes of a pack into the library, returns (added, skipped)"""
+    existing = set(palette_names(directory))
+    added = skipped = 0
+    for name, colors in read_pack(filepath).items():
+        if name in existing and not overwrite:
+            skipped += 1
+            continue
+        save_palette(name, colors, directory)
+        added += 1
+    return added, skipped
+
+
+def clear():
+    _listing.update(dir=None, mtime=None, names=())
+    _parse.cache_clear()
@@ -0,0 +1,198 @@
+import bpy
+import json
+import platform
+import time
+from collections import deque
+from bpy_extras.io_utils import ExportHelper
+
+
+# [ Stats ]
+WINDOW = 500
+METHODS = ('draw', 'draw_header', 'poll', 'execute', 'invoke', 'modal', 'filter_items', 'draw_item')
+
+class Stat:
+    __slots__ = ('count', 'total', 'max', 'samples', 'tree_size')
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples = deque(maxlen=WINDOW)
+        self.tree_size = 0
+
+    def add(self, duration, tree_size):
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.samples.append(duration)
+        self.tree_size = tree_size
+
+    def as_dict(self):
+        samples = sorted(self.samples)
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))] if samples else 0.0
+        return {
+            'count':self.count,
+            'mean_ms':round(self.total / self.count * 1000.0, 4) if self.count else 0.0,
+            'p95_ms':round(p95 * 1000.0, 4),
+            'max_ms':round(self.max * 1000.0, 4),
+            'tree_size':self.tree_size,
+        }
+
+_stats = {}
+
+def reset():
+    _stats.clear()
+
+def stats():
+    return {key: stat.as_dict() for key, stat in sorted(_stats.items())}
+
+
+def tree_size(context):
+    tree = getattr(getattr(context, 'space_data', None), 'edit_tree', None)
+    return len(tree.nodes) if tree else 0
+
+
+# [ Instrumentation ]
+_targets = []
+_originals = {}
+
+def _timed(key, func, context_arg):
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            context = args[context_arg] if len(args) > context_arg else bpy.context
+            stat = _stats.get(key)
+            if stat is None:
+                stat = _stats[key] = Stat()
+            stat.add(duration, tree_size(context))
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def enable():
+    if _originals:
+        return
+    for cls in _targets:
+        for name in METHODS:
+            attr = cls.__dict__.get(name)
+            if attr is None:
+                continue
+            key = f"{cls.__name__}.{name}"
+            _originals[(cls, name)] = attr
+            if isinstance(attr, classmethod):
+                setattr(cls, name, classmethod(_timed(key, attr.__func__, 1)))
+            else:
+                setattr(cls, name, _timed(key, attr, 1))
+
+
+def disable():
+    for (cls, name), attr in _originals.items():
+        setattr(cls, name, attr)
+    _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def toggle_update(self, context):
+    if self.frame_focus_profiling:
+        enable()
+    else:
+        disable()
+
+
+def dump(filepath):
+    data = {
+        'blender':bpy.app.version_string,
+        'platform':platform.platform(),
+        'time':time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'stats':stats(),
+    }
+    with open(filepath, 'w') as f:
+        json.dump(data, f, indent=2)
+    return data
+
+
+# [ Operator ]
+class FRAMEFOCUS_OT_Profile_Dump(bpy.types.Operator, ExportHelper):
+    """Save The Timing Stats To A JSON File"""
+    bl_idname = "frame_focus.profile_dump"
+    bl_label = "Save Timing Stats"
+    filename_ext = ".json"
+    filter_glob : bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    def execute(self, context):
+        dump(self.filepath)
+        self.report({'INFO'}, f"Saved {self.filepath}")
+        return {'FINISHED'}
+
+class FRAMEFOCUS_OT_Profile_Reset(bpy.types.Operator):
+    """Clear The Timing Stats"""
+    bl_idname = "frame_focus.profile_reset"
+    bl_label = "Reset Timing Stats"
+    def execute(self, context):
+        reset()
+        return {'FINISHED'}
+
+
+# [ Panel ]
+class FRAMEFOCUS_PT_Debug(bpy.types.Panel):
+    bl_idname = "FRAMEFOCUS_PT_Debug"
+    bl_space_type = 'NODE_EDITOR'
+    bl_region_type = 'UI'
+    bl_category = "Frames"
+    bl_label = 'Profiling'
+    bl_options = {'DEFAULT_CLOSED'}
+    bl_parent_id = "FRAMEFOCUS_PT_Main"
+    bl_order = 100
+
+    def draw_header(self, context):
+        self.layout.prop(context.window_manager,'frame_focus_profiling',text='')
+
+    def draw(self, context):
+        layout = self.layout
+        row = layout.row(align=True)
+        row.operator("frame_focus.profile_dump",icon='EXPORT')
+        row.operator("frame_focus.profile_reset",text='',icon='TRASH')
+        data = stats()
+        if not data:
+            layout.label(text='No samples' if is_enabled() else 'Profiling is off',icon='INFO')
+            return None
+        col = layout.column(align=True)
+        row = col.row()
+        for text in ('Call','Count','Mean','P95','Max','Nodes'):
+            row.label(text=text)
+        for key, stat in data.items():
+            row = col.row()
+            row.label(text=key.replace('FRAMEFOCUS_',''))
+            row.label(text=str(stat['count']))
+            row.label(text=f"{stat['mean_ms']:.2f}")
+            row.label(text=f"{stat['p95_ms']:.2f}")
+            row.label(text=f"{stat['max_ms']:.2f}")
+            row.label(text=str(stat['tree_size']))
+
+
+classes = (
+    FRAMEFOCUS_OT_Profile_Dump,
+    FRAMEFOCUS_OT_Profile_Reset,
+    FRAMEFOCUS_PT_Debug,
+)
+
+def register(modules=()):
+    _targets[:] = [cls for module in modules for cls in module.classes]
+    bpy.types.WindowManager.frame_focus_profiling = bpy.props.BoolProperty(
+        name='Profiling', default=False, update=toggle_update,
+        description='Time every Frame Focus draw, poll and operator')
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    disable()
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
+    del bpy.types.WindowManager.frame_focus_profiling
+    _targets.clear()
+    reset()
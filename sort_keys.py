@@ -0,0 +1,87 @@
+import numpy as np
+from .color_math import nearest
+
+
+# [ Color Keys ]
+def rgb_to_hsv(colors):
+    """Vectorized `Color.hsv` for an (n, 3) array of RGB rows"""
+    colors = np.asarray(colors, dtype=np.float64)
+    r, g, b = colors[:, 0], colors[:, 1], colors[:, 2]
+    v = colors.max(axis=1)
+    chroma = v - colors.min(axis=1)
+    s = np.where(v > 0.0, chroma / np.where(v > 0.0, v, 1.0), 0.0)
+
+    safe = np.where(chroma > 0.0, chroma, 1.0)
+    h = np.where(v == r, (g - b) / safe,
+        np.where(v == g, 2.0 + (b - r) / safe, 4.0 + (r - g) / safe))
+    h = np.where(chroma > 0.0, (h / 6.0) % 1.0, 0.0)
+    return h, s, v
+
+
+def hue_keys(colors):
+    """Integer keys of the 'Color(Hue)' order: hue, then value, then saturation"""
+    h, s, v = rgb_to_hsv(colors)
+    H = ((1.0 - h) * 255).astype(np.int64)
+    V = ((1.0 - v) * 255).astype(np.int64)
+    S = ((1.0 - s) * 255).astype(np.int64)
+    return H * 10**6 + V * 10**3 + S
+
+
+# [ Perceptual Keys ]
+# Key functions over (n, 3) CIELAB rows, see color_math.rgb_to_lab
+GREY_CHROMA = 4.0
+
+
+def lightness_keys(lab):
+    """Lightness, then hue angle: dark to light"""
+    return (lab[:, 0], lab_hue(lab))
+
+
+def lab_hue(lab):
+    return np.arctan2(lab[:, 2], lab[:, 1]) % (2.0 * np.pi)
+
+
+def lab_hue_keys(lab):
+    """Hue angle, then lightness. Greys (low chroma) have no usable hue and go last"""
+    grey = np.hypot(lab[:, 1], lab[:, 2]) < GREY_CHROMA
+    return (grey, np.where(grey, 0.0, lab_hue(lab)), lab[:, 0])
+
+
+def palette_keys(lab, palette_lab):
+    """Nearest palette entry, then lightness: frames are grouped by palette color"""
+    return (nearest(lab, palette_lab), lab[:, 0])
+
+
+# [ Orders ]
+def stable_order(keys, reverse=False):
+    """Indices sorting `keys`, equal keys keep their current order (like list.sort)"""
+    keys = np.asarray(keys)
+    if reverse:
+        keys = -keys
+    return np.argsort(keys, kind='stable')
+
+
+def key_order(columns, reverse=False):
+    """Indices sorting by several key columns (first is primary), ties keep their order"""
+    columns = [np.asarray(column, dtype=np.float64) for column in columns]
+    if reverse:
+        columns = [-column for column in columns]
+    return np.lexsort(columns[::-1])
+
+
+def label_order(labels, reverse=False):
+    return sorted(range(len(labels)), key=labels.__getitem__, reverse=reverse)
+
+
+def merge_in_place(order, selected, sorted_selected):
+    """Put `sorted_selected` into the slots of the selected items of `order`.
+
+    Unselected items keep their index, one linear pass.
+    """
+    selected = set(selected)
+    result = list(order)
+    items = iter(sorted_selected)
+    for i, item in enumerate(order):
+        if item in selected:
+            result[i] = next(items)
+    return result
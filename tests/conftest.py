@@ -0,0 +1,10 @@
+# The add-on is loaded on the fake bpy of the benchmarks (no Blender needed),
+# as the `frame_focus` package: tests import its modules directly.
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import run_benchmarks
+
+run_benchmarks.load_addon()
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from frame_focus import color_math
+
+
+def test_lab_reference_values():
+    lab = color_math.rgb_to_lab([[1, 1, 1], [0, 0, 0], [1, 0, 0]])
+    assert np.allclose(lab[0], [100, 0, 0], atol=1e-3)
+    assert np.allclose(lab[1], [0, 0, 0], atol=1e-6)
+    assert np.allclose(lab[2], [53.24, 80.09, 67.20], atol=0.01)
+
+
+def test_lab_round_trip():
+    rgb = np.random.default_rng(2).random((200, 3))
+    assert np.allclose(color_math.lab_to_rgb(color_math.rgb_to_lab(rgb)), rgb, atol=1e-6)
+
+
+def test_srgb_linear_round_trip():
+    rgb = np.linspace(0.0, 1.0, 101)
+    assert np.allclose(color_math.linear_to_srgb(color_math.srgb_to_linear(rgb)), rgb, atol=1e-9)
+
+
+def test_rgb_is_clipped():
+    assert np.allclose(color_math.rgb_to_lab([[2.0, -1.0, 1.0]]), color_math.rgb_to_lab([[1.0, 0.0, 1.0]]))
+
+
+def test_nearest():
+    palette = np.array([[0.0, 0, 0], [50, 0, 0], [100, 0, 0]])
+    lab = np.array([[10.0, 0, 0], [60, 5, 5], [99, 0, 0], [26, 0, 0]])
+    assert list(color_math.nearest(lab, palette)) == [0, 1, 2, 1]
+
+
+def test_kmeans_finds_clusters_sorted_by_lightness():
+    rng = np.random.default_rng(3)
+    centers = np.array([[80.0, 10, 10], [20, -30, 40], [50, 60, -20]])
+    lab = np.concatenate([center + rng.normal(0, 1, (40, 3)) for center in centers])
+    found = color_math.kmeans(lab, 3)
+    assert found.shape == (3, 3)
+    assert list(found[:, 0]) == sorted(found[:, 0])
+    assert np.allclose(found, centers[np.argsort(centers[:, 0])], atol=1.0)
+
+
+def test_kmeans_caps_k_at_distinct_colors():
+    lab = np.array([[10.0, 0, 0]] * 5 + [[90.0, 0, 0]] * 5)
+    assert np.allclose(color_math.kmeans(lab, 9), [[10, 0, 0], [90, 0, 0]])
+    assert color_math.kmeans(np.empty((0, 3)), 4).shape == (0, 3)
+
+
+def test_kmeans_is_deterministic():
+    lab = np.random.default_rng(4).random((60, 3)) * 100
+    assert np.array_equal(color_math.kmeans(lab, 5), color_math.kmeans(lab, 5))
@@ -0,0 +1,60 @@
+import pytest
+
+from frame_focus import frame_search
+
+
+@pytest.fixture
+def index():
+    index = frame_search.TrigramIndex()
+    index.sync([('F1', 'Lighting setup'), ('F2', 'Background light'), ('F3', 'Textures'),
+                ('F4', 'Light'), ('F5', 'Shadow catcher')])
+    return index
+
+
+def test_prefix_then_substring_then_fuzzy(index):
+    # Prefix matches (shorter first), then substrings
+    assert index.search('light') == ['F4', 'F1', 'F2']
+    assert index.search('lihgting setup')[:1] == ['F1']
+
+
+def test_case_and_whitespace_are_ignored(index):
+    assert index.search('  TEXT ') == ['F3']
+    assert index.search('') == index.search('   ') == []
+
+
+def test_short_queries_scan_substrings(index):
+    assert set(index.search('ca')) == {'F5'}
+    assert set(index.search('g')) == {'F1', 'F2', 'F4'}
+
+
+def test_limit_and_threshold(index):
+    assert index.search('light', limit=2) == ['F4', 'F1']
+    assert index.search('zzzz') == []
+
+
+def test_rank_breaks_ties(index):
+    index.sync([('a', 'cat x'), ('b', 'cat'), ('c', 'cat yy')])
+    assert index.search('cat') == ['b', 'a', 'c']
+    assert index.search('cat', rank={'c':0, 'a':1, 'b':2}) == ['c', 'a', 'b']
+
+
+def test_sync_only_reindexes_changes(index):
+    assert index.sync([('F1', 'Lighting setup'), ('F2', 'Sky'), ('F6', 'New')]) == 2
+    assert len(index) == 3
+    assert index.search('background') == []
+    assert index.search('sky') == ['F2']
+    assert all(key in index.docs for keys in index.postings.values() for key in keys)
+
+
+def test_remove_drops_empty_postings():
+    index = frame_search.TrigramIndex()
+    index.update('a', 'unique')
+    index.remove('a')
+    index.remove('a')
+    assert len(index) == 0 and not index.postings
+
+
+def test_helpers():
+    assert frame_search.is_subsequence('lgt', 'light')
+    assert not frame_search.is_subsequence('tl', 'light')
+    assert frame_search.trigrams('ab') == {'  a', ' ab', 'ab '}
@@ -0,0 +1,73 @@
+import random
+
+import pytest
+
+from frame_focus import frame_spatial
+
+
+# Outer frame with two frames inside, and one far to the right
+RECTS = [(0, 0, 1000, 600), (50, 50, 300, 250), (400, 50, 900, 500), (3000, 0, 3200, 300)]
+KEYS = ['outer', 'left', 'right', 'far']
+
+
+@pytest.fixture
+def grid():
+    return frame_spatial.SpatialGrid(RECTS, KEYS)
+
+
+def test_at_point_innermost_first(grid):
+    assert grid.at_point(100, 100) == ['left', 'outer']
+    assert grid.at_point(950, 550) == ['outer']
+    assert grid.at_point(2000, 100) == []
+
+
+def test_in_rect(grid):
+    assert grid.in_rect((200, 100, 450, 120)) == {'outer', 'left', 'right'}
+    assert grid.in_rect((-10**6, -10**6, 10**6, 10**6)) == set(KEYS)
+    assert grid.in_rect((1500, 0, 2500, 100)) == set()
+
+
+def test_nearest_by_direction(grid):
+    assert grid.nearest(175, 150, 'RIGHT', exclude={'left'}) == 'outer'
+    assert grid.nearest(175, 150, 'RIGHT', exclude={'left', 'outer'}) == 'right'
+    assert grid.nearest(3100, 150, 'RIGHT') is None
+    assert grid.nearest(3100, 150, 'LEFT', exclude={'far'}) == 'right'
+
+
+def test_empty_grid():
+    grid = frame_spatial.SpatialGrid([], [])
+    assert len(grid) == 0
+    assert grid.at_point(0, 0) == [] and grid.in_rect((0, 0, 1, 1)) == set()
+    assert grid.nearest(0, 0, 'UP') is None
+
+
+def brute_nearest(rects, keys, x, y, direction, dirs):
+    dx, dy = dirs[direction]
+    best = None
+    for rect, key in zip(rects, keys):
+        cx, cy = (rect[0] + rect[2]) * 0.5, (rect[1] + rect[3]) * 0.5
+        along = (cx - x) * dx + (cy - y) * dy
+        if along <= 1.0:
+            continue
+        score = along + 2.0 * abs((cx - x) * dy - (cy - y) * dx)
+        if best is None or score < best[0]:
+            best = (score, key)
+    return None if best is None else best[1]
+
+
+def test_matches_brute_force():
+    rng = random.Random(5)
+    rects = []
+    for _ in range(300):
+        x, y = rng.uniform(-5000, 5000), rng.uniform(-5000, 5000)
+        rects.append((x, y, x + rng.uniform(50, 800), y + rng.uniform(50, 800)))
+    keys = list(range(len(rects)))
+    grid = frame_spatial.SpatialGrid(rects, keys)
+    for _ in range(100):
+        x, y = rng.uniform(-6000, 6000), rng.uniform(-6000, 6000)
+        assert set(grid.at_point(x, y)) == {k for r, k in zip(rects, keys) if r[0] <= x <= r[2] and r[1] <= y <= r[3]}
+        area = (x, y, x + 1000, y + 700)
+        assert grid.in_rect(area) == {k for r, k in zip(rects, keys)
+                                      if r[0] <= area[2] and r[2] >= area[0] and r[1] <= area[3] and r[3] >= area[1]}
+        for direction in frame_spatial.DIRECTIONS:
+            assert grid.nearest(x, y, direction) == brute_nearest(rects, keys, x, y, direction, frame_spatial.DIRECTIONS)
@@ -0,0 +1,95 @@
+import json
+
+import pytest
+
+from frame_focus import palette_library
+
+
+@pytest.fixture(autouse=True)
+def fresh_listing():
+    palette_library.clear()
+
+
+COLORS = [(i / 10, 0.5, 1.0 - i / 10) for i in range(9)]
+
+
+def write(path, data):
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding='utf-8')
+    return str(path)
+
+
+def test_validate_clamps_and_converts():
+    colors = [[2, -1, '0.5']] + [[0, 0, 0]] * 8
+    assert palette_library.validate(colors)[0] == (1.0, 0.0, 0.5)
+
+
+@pytest.mark.parametrize('colors', [None, 'abc', COLORS[:8], COLORS + [(0, 0, 0)],
+                                    [(0, 0)] + COLORS[1:], [('x', 0, 0)] + COLORS[1:],
+                                    [(None, 0, 0)] + COLORS[1:], [1.0] + COLORS[1:]])
+def test_validate_rejects(colors):
+    with pytest.raises(ValueError):
+        palette_library.validate(colors)
+
+
+def test_save_load_round_trip(tmp_path):
+    directory = str(tmp_path)
+    path = palette_library.save_palette('My/Palette', COLORS, directory)
+    assert path.endswith('My_Palette.json')
+    assert palette_library.palette_names(directory) == ('My_Palette',)
+    assert palette_library.load_palette('My_Palette', directory) == tuple(COLORS)
+
+    palette_library.save_palette('another', COLORS[::-1], directory)
+    assert palette_library.palette_names(directory) == ('another', 'My_Palette')
+    assert palette_library.remove_palette('another', directory)
+    assert not palette_library.remove_palette('another', directory)
+    assert palette_library.palette_names(directory) == ('My_Palette',)
+
+
+def test_missing_library_lists_nothing(tmp_path):
+    assert palette_library.palette_names(str(tmp_path / 'missing')) == ()
+
+
+def test_pack_round_trip(tmp_path):
+    source, target = tmp_path / 'source', tmp_path / 'target'
+    source.mkdir()
+    target.mkdir()
+    palette_library.save_palette('a', COLORS, str(source))
+    palette_library.save_palette('b', COLORS[::-1], str(source))
+    pack = str(tmp_path / 'pack.json')
+    assert palette_library.export_pack(pack, directory=str(source)) == 2
+    assert palette_library.read_pack(pack) == {'a':tuple(COLORS), 'b':tuple(COLORS[::-1])}
+
+    palette_library.save_palette('a', COLORS[::-1], str(target))
+    assert palette_library.import_pack(pack, directory=str(target)) == (1, 1)
+    assert palette_library.load_palette('a', str(target)) == tuple(COLORS[::-1])
+    assert palette_library.import_pack(pack, overwrite=True, directory=str(target)) == (2, 0)
+    assert palette_library.load_palette('a', str(target)) == tuple(COLORS)
+
+
+def test_single_palette_file_is_a_pack_of_one(tmp_path):
+    path = write(tmp_path / 'single.json', {'colors':COLORS})
+    assert palette_library.read_pack(path) == {'single':tuple(COLORS)}
+    path = write(tmp_path / 'named.json', {'name':12, 'colors':COLORS})
+    assert list(palette_library.read_pack(path)) == ['12']
+
+
+@pytest.mark.parametrize('data', [[1, 2], 'null', {'palettes':[COLORS]}, {'palettes':{'a':COLORS[:3]}},
+                                  {'name':'x'}])
+def test_read_pack_rejects(tmp_path, data):
+    path = write(tmp_path / 'bad.json', data)
+    with pytest.raises(ValueError):
+        palette_library.read_pack(path)
+
+
+def test_legacy_preset_is_parsed_not_executed(tmp_path):
+    lines = ["import bpy", "fc = bpy.context.scene.frame_color", "raise SystemExit"]
+    lines += [f"fc.color_{i + 1} = {tuple(color)!r}" for i, color in enumerate(COLORS)]
+    path = write(tmp_path / 'Old Preset.py', "\n".join(lines))
+    assert palette_library.read_pack(path) == {'Old Preset':tuple(COLORS)}
+
+
+@pytest.mark.parametrize('source', ["fc.color_1 = (", "fc.color_1 = foo()", "fc.color_1 = (0, 0, 0)"])
+def test_read_legacy_preset_rejects(tmp_path, source):
+    path = write(tmp_path / 'bad.py', source)
+    with pytest.raises(ValueError):
+        palette_library.read_legacy_preset(path)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from frame_focus import sort_keys
+from frame_focus.color_math import rgb_to_lab
+
+
+def test_rgb_to_hsv_matches_colorsys():
+    import colorsys
+    colors = np.random.default_rng(1).random((50, 3))
+    colors[:5] = [[0, 0, 0], [1, 1, 1], [0.5, 0.5, 0.5], [1, 0, 0], [0, 0, 1]]
+    h, s, v = sort_keys.rgb_to_hsv(colors)
+    expected = np.array([colorsys.rgb_to_hsv(*color) for color in colors])
+    assert np.allclose(np.stack([h, s, v], axis=1), expected)
+
+
+def test_hue_keys_order():
+    # Higher hue first, then brighter, then more saturated
+    colors = [[1, 0, 0], [0, 0, 1], [0, 1, 0], [0, 0, 0.5], [0.5, 0.5, 1]]
+    order = sort_keys.stable_order(sort_keys.hue_keys(colors))
+    assert list(order) == [1, 4, 3, 2, 0]
+
+
+def test_stable_order_keeps_ties():
+    assert list(sort_keys.stable_order([2, 1, 2, 1])) == [1, 3, 0, 2]
+    assert list(sort_keys.stable_order([2, 1, 2, 1], reverse=True)) == [0, 2, 1, 3]
+
+
+def test_key_order_first_column_is_primary():
+    primary = [1, 0, 1, 0]
+    secondary = [0.5, 0.7, 0.1, 0.7]
+    assert list(sort_keys.key_order((primary, secondary))) == [1, 3, 2, 0]
+    assert list(sort_keys.key_order((primary, secondary), reverse=True)) == [0, 2, 1, 3]
+
+
+def test_label_order():
+    labels = ['b', 'a', 'c', 'a']
+    assert sort_keys.label_order(labels) == [1, 3, 0, 2]
+    assert sort_keys.label_order(labels, reverse=True) == [2, 0, 1, 3]
+
+
+def test_merge_in_place():
+    order = list('abcdef')
+    assert sort_keys.merge_in_place(order, 'bdf', 'fbd') == list('afcbed')
+    assert sort_keys.merge_in_place(order, '', '') == order
+
+
+def test_lightness_keys_dark_to_light():
+    rows = rgb_to_lab([[1, 1, 1], [0, 0, 0], [0.5, 0.5, 0.5]])
+    assert list(sort_keys.key_order(sort_keys.lightness_keys(rows))) == [1, 2, 0]
+
+
+def test_lab_hue_keys_put_greys_last():
+    rows = rgb_to_lab([[0.5, 0.5, 0.5], [0, 0, 1], [1, 0, 0], [0, 1, 0]])
+    order = list(sort_keys.key_order(sort_keys.lab_hue_keys(rows)))
+    assert order[-1] == 0
+    # Lab hue angles: red ~40deg, green ~136deg, blue ~306deg
+    assert order[:3] == [2, 3, 1]
+
+
+def test_palette_keys_group_by_nearest_entry():
+    palette = rgb_to_lab([[1, 0, 0], [0, 0, 1]])
+    rows = rgb_to_lab([[0, 0, 0.9], [0.9, 0, 0], [0.5, 0, 0], [0, 0, 0.4]])
+    groups, lightness = sort_keys.palette_keys(rows, palette)
+    assert list(groups) == [1, 0, 0, 1]
+    assert list(sort_keys.key_order((groups, lightness))) == [2, 1, 3, 0]
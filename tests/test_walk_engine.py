@@ -0,0 +1,52 @@
+import pytest
+
+from frame_focus import walk_engine
+
+
+def walk_one_by_one(order, selected, walk_type, steps):
+    for _ in range(steps):
+        order = walk_engine.walk(order, selected, walk_type, 1)
+    return order
+
+
+ORDER = list('abcdefgh')
+
+
+@pytest.mark.parametrize('walk_type', ['WALK_UP', 'WALK_DOWN'])
+@pytest.mark.parametrize('selected', ['a', 'h', 'cd', 'ceg', 'abh', 'bcdefg', 'abcdefgh'])
+@pytest.mark.parametrize('steps', [1, 2, 3, 10])
+def test_walk_matches_repeated_single_steps(walk_type, selected, steps):
+    assert walk_engine.walk(ORDER, selected, walk_type, steps) == walk_one_by_one(ORDER, selected, walk_type, steps)
+
+
+def test_walk_to_ends():
+    assert walk_engine.walk(ORDER, 'df', 'TO_TOP') == list('dfabcegh')
+    assert walk_engine.walk(ORDER, 'bd', 'TO_BOTTOM') == list('acefghbd')
+
+
+def test_walk_blocked_items_keep_their_order():
+    assert walk_engine.walk(ORDER, 'abe', 'WALK_UP', 2) == list('abecdfgh')
+
+
+def test_walk_without_selection_or_steps():
+    assert walk_engine.walk(ORDER, '', 'WALK_UP') == ORDER
+    assert walk_engine.walk(ORDER, 'c', 'WALK_DOWN', 0) == ORDER
+    result = walk_engine.walk(ORDER, 'c', 'WALK_DOWN')
+    assert result is not ORDER and ORDER == list('abcdefgh')
+
+
+def test_walk_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        walk_engine.walk(ORDER, 'a', 'SIDEWAYS')
+
+
+def test_walk_targets():
+    assert walk_engine.walk_targets(8, [0, 3], -2) == [0, 1]
+    assert walk_engine.walk_targets(8, [6, 7], 3) == [6, 7]
+    assert walk_engine.walk_targets(8, [2, 4], 1) == [3, 5]
+
+
+def test_permute():
+    assert walk_engine.permute(list('abcde'), [1, 3], [0, 4]) == list('baced')
+    assert walk_engine.permute(list('abc'), [], []) == list('abc')
+    assert sorted(walk_engine.permute(ORDER, [0, 5, 7], [2, 3, 4])) == ORDER
@@ -0,0 +1,51 @@
+# Frame order walking, computed as a single permutation.
+# Pure Python (no bpy) so it can run on plain lists of names.
+
+WALK_TYPES = ('WALK_UP', 'WALK_DOWN', 'TO_TOP', 'TO_BOTTOM')
+
+
+def walk_targets(count, positions, offset):
+    """New positions of the selected items after moving them by `offset` slots.
+
+    `positions` must be sorted. Negative offsets walk up, positive walk down.
+    Items blocked by the list ends or by other blocked selected items pile up
+    in their original order, the same as repeating a one-slot walk.
+    """
+    total = len(positions)
+    if offset < 0:
+        return [max(pos + offset, k) for k, pos in enumerate(positions)]
+    return [min(pos + offset, count - total + k) for k, pos in enumerate(positions)]
+
+
+def permute(order, positions, targets):
+    """Place the items at `positions` onto `targets`, the rest keep their relative order"""
+    result = [None] * len(order)
+    taken = [False] * len(order)
+    for pos, target in zip(positions, targets):
+        result[target] = order[pos]
+        taken[target] = True
+    moved = set(positions)
+    rest = (item for pos, item in enumerate(order) if pos not in moved)
+    for i in range(len(result)):
+        if not taken[i]:
+            result[i] = next(rest)
+    return result
+
+
+def walk(order, selected, walk_type='WALK_UP', steps=1):
+    """Return `order` with the `selected` items walked.
+
+    walk_type: 'WALK_UP', 'WALK_DOWN' (by `steps` slots), 'TO_TOP' or 'TO_BOTTOM'.
+    """
+    if walk_type not in WALK_TYPES:
+        raise ValueError(f"unknown walk type: {walk_type!r}")
+    selected = set(selected)
+    positions = [i for i, item in enumerate(order) if item in selected]
+    if not positions or steps < 1:
+        return list(order)
+
+    count = len(order)
+    if walk_type in ('TO_TOP', 'TO_BOTTOM'):
+        steps = count
+    offset = -steps if walk_type in ('WALK_UP', 'TO_TOP') else steps
+    return permute(order, positions, walk_targets(count, positions, offset))